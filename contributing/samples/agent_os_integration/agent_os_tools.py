@@ -14,19 +14,31 @@
 
 """Agent OS tools integration for ADK."""
 
+import asyncio
+import base64
+import contextlib
+import copy
+import fnmatch
+import functools
 import os
-import subprocess
-import tempfile
+import re
+import shlex
+import shutil
+import signal
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Import ADK tools - use more robust import method
 try:
     # Try direct import first (when ADK is properly installed)
     from google.adk.tools.base_tool import BaseTool
     from google.adk.tools.base_toolset import BaseToolset
+    from google.adk.tools.base_toolset import ToolPredicate
     from google.adk.tools.tool_context import ToolContext
     from google.adk.tools.transfer_to_agent_tool import transfer_to_agent
+    from google.genai import types
 except ImportError:
     # Fallback: Add src directory only if direct import fails
     import sys
@@ -41,8 +53,10 @@ except ImportError:
         try:
             from google.adk.tools.base_tool import BaseTool
             from google.adk.tools.base_toolset import BaseToolset
+            from google.adk.tools.base_toolset import ToolPredicate
             from google.adk.tools.tool_context import ToolContext
             from google.adk.tools.transfer_to_agent_tool import transfer_to_agent
+            from google.genai import types
         except ImportError as e:
             raise ImportError(
                 f"Could not import ADK tools. Please ensure ADK is installed or "
@@ -55,6 +69,347 @@ except ImportError:
         )
 
 
+# Bound once so the declaration builders skip the module attribute lookups.
+_FunctionDeclaration = types.FunctionDeclaration
+_Schema = types.Schema
+_Type = types.Type
+
+# External executables, resolved once at import. grep_search falls back to
+# grep without ripgrep.
+_RG = shutil.which("rg")
+_GREP = shutil.which("grep") or "grep"
+_BASH = shutil.which("bash")
+_CPU_COUNT = os.cpu_count() or 4
+
+# Patterns without any of these can be searched as plain literals.
+_REGEX_META_RE = re.compile(r"[.^$*+?()[\]{}|\\]")
+
+# Longest single line kept from a streamed search; longer lines are cut.
+_STREAM_LINE_LIMIT = 1 << 20
+
+# Size of each read from a streamed search's stdout.
+_STREAM_CHUNK_BYTES = 1 << 16
+
+# Characters that need a shell to interpret: pipes, redirection, command
+# separators, expansion, globbing and so on.
+_SHELL_META_RE = re.compile(r"[|&;<>()$`\\\"'*?\[\]#~=%{}\n]")
+
+
+def _simple_argv(command: str) -> Optional[List[str]]:
+    """Split a command that needs no shell into argv, else return None."""
+    if _SHELL_META_RE.search(command):
+        return None
+    argv = shlex.split(command)
+    return argv or None
+
+
+# Per-stream cap on captured subprocess output.
+_MAX_OUTPUT_BYTES = 1 << 20
+
+
+def _kill(proc) -> None:
+    """Kill a child started by ``_run`` along with anything it spawned."""
+    with contextlib.suppress(ProcessLookupError):
+        if hasattr(os, "killpg"):
+            # Killing only the shell would leave a pipeline's other
+            # processes holding the output pipes open.
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+
+
+async def _read_capped(proc, stream):
+    """Read ``stream`` up to the output cap, killing ``proc`` past it."""
+    chunks = []
+    total = 0
+    while chunk := await stream.read(65536):
+        total += len(chunk)
+        if total > _MAX_OUTPUT_BYTES:
+            chunks.append(chunk[:len(chunk) - (total - _MAX_OUTPUT_BYTES)])
+            _kill(proc)
+            return b"".join(chunks), True
+        chunks.append(chunk)
+    return b"".join(chunks), False
+
+
+async def _run(cmd, *, cwd=None, timeout, shell=False):
+    """Run a command without blocking the event loop.
+
+    Returns ``(return_code, stdout, stderr, truncated)`` with output decoded
+    as text. Each stream is capped at ``_MAX_OUTPUT_BYTES``; a child that
+    exceeds it is killed and ``truncated`` is True. On timeout the child is
+    killed and reaped before ``asyncio.TimeoutError`` propagates to the
+    caller.
+    """
+    pipe = asyncio.subprocess.PIPE
+    if shell:
+        proc = await asyncio.create_subprocess_shell(
+            cmd, cwd=cwd, stdout=pipe, stderr=pipe, executable=_BASH,
+            start_new_session=True,
+        )
+    else:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, cwd=cwd, stdout=pipe, stderr=pipe, start_new_session=True
+        )
+
+    async def drain():
+        (stdout, out_cut), (stderr, err_cut) = await asyncio.gather(
+            _read_capped(proc, proc.stdout), _read_capped(proc, proc.stderr)
+        )
+        await proc.wait()
+        return stdout, stderr, out_cut or err_cut
+
+    try:
+        stdout, stderr, truncated = await asyncio.wait_for(drain(), timeout)
+    except asyncio.TimeoutError:
+        _kill(proc)
+        await proc.wait()
+        raise
+    return (
+        proc.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+        truncated,
+    )
+
+
+# Files up to this size are read with a single os.read call.
+_READ_CHUNK_BYTES = 1 << 20
+
+
+def _read_file(file_path: str, encoding: str) -> str:
+    # Read through the raw fd with no BufferedReader or TextIOWrapper, and
+    # decode once at the end.
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        if 0 < size <= _READ_CHUNK_BYTES:
+            data = os.read(fd, size)
+            if len(data) == size:
+                return data.decode(encoding, errors="replace")
+            chunks.append(data)
+        # Large files, short reads, and files whose size stat does not
+        # report (such as those under /proc) are read to EOF in chunks.
+        while True:
+            chunk = os.read(fd, _READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode(encoding, errors="replace")
+
+
+class _ReadCache:
+    """Decoded file contents by absolute path, bounded by total file size.
+
+    Each entry carries the stat signature it was read under and is only
+    served while the file still matches it. Writers that know they changed
+    a file drop its entry rather than relying on the signature alone.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._max_bytes = max_bytes
+        # read_files reads on several threads at once.
+        self._lock = threading.Lock()
+
+    def get(self, path: str, signature: tuple) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != signature:
+                return None
+            self._entries.move_to_end(path)
+            return entry[1]
+
+    def put(self, path: str, signature: tuple, text: str, size: int) -> None:
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[path] = (signature, text, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def discard(self, path: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(path, None)
+            if entry is not None:
+                self._bytes -= entry[2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+# Files larger than this are always read from disk rather than cached.
+_READ_CACHE_MAX_FILE_BYTES = 1 << 20
+
+# write_file drops the entry for each path it writes, and bash_command clears
+# the cache after every command, since a command may change any file.
+_READ_CACHE = _ReadCache(max_bytes=16 << 20)
+
+
+def _read_sync(file_path: str, encoding: str = "utf-8") -> str:
+    """Read a text file; run via ``asyncio.to_thread`` to keep the loop free."""
+    abs_path = os.path.abspath(file_path)
+    st = os.stat(abs_path)
+    if st.st_size > _READ_CACHE_MAX_FILE_BYTES:
+        return _read_file(abs_path, encoding)
+    # ctime and the inode also change on rewrites and renames that keep
+    # the size and land within one mtime tick.
+    signature = (
+        st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino, encoding
+    )
+    text = _READ_CACHE.get(abs_path, signature)
+    if text is None:
+        text = _read_file(abs_path, encoding)
+        _READ_CACHE.put(abs_path, signature, text, st.st_size)
+    return text
+
+
+def _read_b64_sync(file_path: str) -> str:
+    """Read a file's raw bytes as base64 text, skipping any decode."""
+    return base64.b64encode(Path(file_path).read_bytes()).decode("ascii")
+
+
+# Largest slice handed to a single os.write call.
+_WRITE_CHUNK_BYTES = 1 << 18
+
+# Directories already created by write_file, so repeated writes into the
+# same tree skip the makedirs stat walk.
+_MKDIR_CACHE = set()
+
+
+def _make_parent_dirs(parent: Path) -> None:
+    """Create ``parent`` and any missing ancestors."""
+    try:
+        parent.mkdir(parents=True, exist_ok=True)
+    except FileExistsError as e:
+        # A component of the path is an existing file. Report it as such so
+        # it is not mistaken for the target file already existing.
+        raise NotADirectoryError(
+            f"Not a directory: {e.filename or parent}"
+        ) from None
+
+
+def _write_sync(file_path: str, content: str, overwrite: bool) -> int:
+    """Write a text file, creating parent directories as needed.
+
+    Returns the number of bytes written. Raises FileExistsError when the
+    file exists and ``overwrite`` is false.
+    """
+    data = memoryview(content.encode("utf-8"))
+    # O_EXCL makes the existence check and the create one atomic step.
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    flags |= os.O_TRUNC if overwrite else os.O_EXCL
+
+    # Create directory if it doesn't exist
+    parent = Path(file_path).absolute().parent
+    if parent not in _MKDIR_CACHE:
+        _make_parent_dirs(parent)
+        _MKDIR_CACHE.add(parent)
+
+    try:
+        fd = os.open(file_path, flags, 0o666)
+    except FileNotFoundError:
+        # The directory was removed after it was cached; recreate it.
+        _make_parent_dirs(parent)
+        fd = os.open(file_path, flags, 0o666)
+    try:
+        # Content is already in memory, so write it straight to the fd in
+        # large slices; os.write may write less than it is given.
+        offset = 0
+        while offset < len(data):
+            offset += os.write(fd, data[offset:offset + _WRITE_CHUNK_BYTES])
+    finally:
+        os.close(fd)
+    _READ_CACHE.discard(os.path.abspath(file_path))
+    return len(data)
+
+
+# Characters that make a glob segment a pattern rather than a literal name.
+_GLOB_MAGIC_RE = re.compile(r"[*?[]")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob_part(part: str):
+    """Compile one glob path segment to a regex match function."""
+    return re.compile(fnmatch.translate(part)).match
+
+
+def _scandir_glob(root: str, pattern: str, limit: int) -> List[str]:
+    """Return up to ``limit`` paths under ``root`` matching a glob pattern.
+
+    Matches like ``glob(os.path.join(root, pattern), recursive=True)``:
+    segments are matched one directory level at a time, ``**`` spans zero
+    or more directories, and hidden names only match segments that start
+    with a dot. It walks with ``os.scandir``, whose entries carry their type
+    from the directory listing, so nothing is stat'ed, and it stops as soon
+    as ``limit`` paths are found. ``**`` does not follow symlinked
+    directories.
+    """
+    if os.path.isabs(pattern):
+        root = os.path.join(os.path.splitdrive(pattern)[0], os.sep)
+    parts = [part for part in re.split(r"[\\/]", pattern) if part]
+    if not parts:
+        return []
+    last = len(parts) - 1
+    results = []
+    # Each entry is a directory and the index of the segment to match in it.
+    stack = [(root, 0)]
+    while stack:
+        path, index = stack.pop()
+        part = parts[index]
+        if not _GLOB_MAGIC_RE.search(part):
+            # Literal segments are looked up directly, without listing.
+            candidate = os.path.join(path, part)
+            if index == last:
+                if os.path.lexists(candidate):
+                    results.append(candidate)
+                    if len(results) >= limit:
+                        return results
+            elif os.path.isdir(candidate):
+                stack.append((candidate, index + 1))
+            continue
+        recursive = part == "**"
+        if recursive and index < last:
+            # ``**`` matching no directories at this level.
+            stack.append((path, index + 1))
+        match = None if recursive else _compile_glob_part(part)
+        show_hidden = part.startswith(".")
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(".") and not show_hidden:
+                        continue
+                    if recursive:
+                        if index == last:
+                            # A trailing ``**`` matches everything below.
+                            results.append(entry.path)
+                            if len(results) >= limit:
+                                return results
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, index))
+                    elif match(name):
+                        if index == last:
+                            results.append(entry.path)
+                            if len(results) >= limit:
+                                return results
+                        elif entry.is_dir():
+                            stack.append((entry.path, index + 1))
+        except OSError:
+            # Unreadable or vanished directories are skipped, as glob does.
+            continue
+    return results
+
+
 class AgentOsReadTool(BaseTool):
     """Tool for reading files in Agent OS workflows."""
 
@@ -64,34 +419,52 @@ class AgentOsReadTool(BaseTool):
             description="Read the contents of a file. Use this to examine files in the project.",
         )
 
-    def _get_declaration(self) -> Optional['types.FunctionDeclaration']:
+    # Declarations never change, so each one is built on first use and kept
+    # on the class for every toolset's instance. Callers get a shallow copy: BaseToolset.get_tools_with_prefix renames
+    # the declaration it is handed.
+    _declaration = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
         """Get function declaration for the LLM."""
-        from google.genai import types
-        return types.FunctionDeclaration(
-            name="read_file",
-            description="Read the contents of a file. Use this to examine files in the project.",
-            parameters=types.Schema(
-                type=types.Type.OBJECT,
-                properties={
-                    "file_path": types.Schema(
-                        type=types.Type.STRING,
-                        description="Path to the file to read"
-                    )
-                },
-                required=["file_path"]
+        if self._declaration is None:
+            type(self)._declaration = _FunctionDeclaration(
+                name="read_file",
+                description="Read the contents of a file. Use this to examine files in the project.",
+                parameters=_Schema(
+                    type=_Type.OBJECT,
+                    properties={
+                        "file_path": _Schema(
+                            type=_Type.STRING,
+                            description="Path to the file to read"
+                        ),
+                        "encoding": _Schema(
+                            type=_Type.STRING,
+                            description="Text encoding of the file (default: 'utf-8')"
+                        ),
+                        "binary": _Schema(
+                            type=_Type.BOOLEAN,
+                            description="Return the raw bytes base64-encoded in content_b64 instead of text (default: False)"
+                        )
+                    },
+                    required=["file_path"]
+                )
             )
-        )
+        return copy.copy(self._declaration)
 
     async def run_async(
         self, *, args: Dict[str, Any], tool_context: ToolContext
     ) -> Any:
         file_path = args.get("file_path")
+        encoding = args.get("encoding", "utf-8")
+        binary = args.get("binary", False)
         if not file_path:
             return {"error": "file_path is required"}
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            if binary:
+                content_b64 = await asyncio.to_thread(_read_b64_sync, file_path)
+                return {"content_b64": content_b64, "file_path": file_path}
+            content = await asyncio.to_thread(_read_sync, file_path, encoding)
             return {"content": content, "file_path": file_path}
         except FileNotFoundError:
             return {"error": f"File not found: {file_path}"}
@@ -99,6 +472,67 @@ class AgentOsReadTool(BaseTool):
             return {"error": f"Error reading file: {str(e)}"}
 
 
+class AgentOsBatchReadTool(BaseTool):
+    """Tool for reading several files in one call in Agent OS workflows."""
+
+    def __init__(self):
+        super().__init__(
+            name="read_files",
+            description="Read the contents of several files at once. Use this instead of repeated read_file calls when you already know which files you need.",
+        )
+
+    _declaration = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+        """Get function declaration for the LLM."""
+        if self._declaration is None:
+            type(self)._declaration = _FunctionDeclaration(
+                name="read_files",
+                description="Read the contents of several files at once. Use this instead of repeated read_file calls when you already know which files you need.",
+                parameters=_Schema(
+                    type=_Type.OBJECT,
+                    properties={
+                        "file_paths": _Schema(
+                            type=_Type.ARRAY,
+                            items=_Schema(type=_Type.STRING),
+                            description="Paths of the files to read"
+                        ),
+                        "encoding": _Schema(
+                            type=_Type.STRING,
+                            description="Text encoding of the files (default: 'utf-8')"
+                        )
+                    },
+                    required=["file_paths"]
+                )
+            )
+        return copy.copy(self._declaration)
+
+    async def run_async(
+        self, *, args: Dict[str, Any], tool_context: ToolContext
+    ) -> Any:
+        file_paths = args.get("file_paths")
+        encoding = args.get("encoding", "utf-8")
+        if not file_paths:
+            return {"error": "file_paths is required"}
+
+        # Issue every read at once on the thread pool rather than one tool
+        # round-trip per file; results share read_file's content cache.
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_read_sync, p, encoding) for p in file_paths),
+            return_exceptions=True,
+        )
+        contents = {}
+        errors = {}
+        for file_path, result in zip(file_paths, results):
+            if isinstance(result, FileNotFoundError):
+                errors[file_path] = f"File not found: {file_path}"
+            elif isinstance(result, Exception):
+                errors[file_path] = f"Error reading file: {str(result)}"
+            else:
+                contents[file_path] = result
+        return {"contents": contents, "errors": errors}
+
+
 class AgentOsWriteTool(BaseTool):
     """Tool for writing files in Agent OS workflows."""
 
@@ -108,31 +542,34 @@ class AgentOsWriteTool(BaseTool):
             description="Write content to a file. Use this to create or update files in the project.",
         )
 
-    def _get_declaration(self) -> Optional['types.FunctionDeclaration']:
+    _declaration = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
         """Get function declaration for the LLM."""
-        from google.genai import types
-        return types.FunctionDeclaration(
-            name="write_file",
-            description="Write content to a file. Use this to create or update files in the project.",
-            parameters=types.Schema(
-                type=types.Type.OBJECT,
-                properties={
-                    "file_path": types.Schema(
-                        type=types.Type.STRING,
-                        description="Path to the file to write"
-                    ),
-                    "content": types.Schema(
-                        type=types.Type.STRING,
-                        description="Content to write to the file"
-                    ),
-                    "overwrite": types.Schema(
-                        type=types.Type.BOOLEAN,
-                        description="Whether to overwrite if file exists (default: False)"
-                    )
-                },
-                required=["file_path", "content"]
+        if self._declaration is None:
+            type(self)._declaration = _FunctionDeclaration(
+                name="write_file",
+                description="Write content to a file. Use this to create or update files in the project.",
+                parameters=_Schema(
+                    type=_Type.OBJECT,
+                    properties={
+                        "file_path": _Schema(
+                            type=_Type.STRING,
+                            description="Path to the file to write"
+                        ),
+                        "content": _Schema(
+                            type=_Type.STRING,
+                            description="Content to write to the file"
+                        ),
+                        "overwrite": _Schema(
+                            type=_Type.BOOLEAN,
+                            description="Whether to overwrite if file exists (default: False)"
+                        )
+                    },
+                    required=["file_path", "content"]
+                )
             )
-        )
+        return copy.copy(self._declaration)
 
     async def run_async(
         self, *, args: Dict[str, Any], tool_context: ToolContext
@@ -145,16 +582,12 @@ class AgentOsWriteTool(BaseTool):
             return {"error": "file_path is required"}
 
         try:
-            # Check if file exists and overwrite is False
-            if os.path.exists(file_path) and not overwrite:
-                return {"error": f"File already exists: {file_path}. Set overwrite=True to overwrite."}
-
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
-            return {"success": True, "file_path": file_path, "bytes_written": len(content)}
+            bytes_written = await asyncio.to_thread(
+                _write_sync, file_path, content, overwrite
+            )
+            return {"success": True, "file_path": file_path, "bytes_written": bytes_written}
+        except FileExistsError:
+            return {"error": f"File already exists: {file_path}. Set overwrite=True to overwrite."}
         except Exception as e:
             return {"error": f"Error writing file: {str(e)}"}
 
@@ -168,35 +601,38 @@ class AgentOsGrepTool(BaseTool):
             description="Search for patterns in files using grep. Use this to find specific content across files.",
         )
 
-    def _get_declaration(self) -> Optional['types.FunctionDeclaration']:
+    _declaration = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
         """Get function declaration for the LLM."""
-        from google.genai import types
-        return types.FunctionDeclaration(
-            name="grep_search",
-            description="Search for patterns in files using grep. Use this to find specific content across files.",
-            parameters=types.Schema(
-                type=types.Type.OBJECT,
-                properties={
-                    "pattern": types.Schema(
-                        type=types.Type.STRING,
-                        description="Pattern to search for"
-                    ),
-                    "file_path": types.Schema(
-                        type=types.Type.STRING,
-                        description="File or directory to search in (default: '.')"
-                    ),
-                    "case_sensitive": types.Schema(
-                        type=types.Type.BOOLEAN,
-                        description="Whether search is case sensitive (default: False)"
-                    ),
-                    "max_lines": types.Schema(
-                        type=types.Type.INTEGER,
-                        description="Maximum number of result lines to return (default: 50)"
-                    )
-                },
-                required=["pattern"]
+        if self._declaration is None:
+            type(self)._declaration = _FunctionDeclaration(
+                name="grep_search",
+                description="Search for patterns in files using grep. Use this to find specific content across files.",
+                parameters=_Schema(
+                    type=_Type.OBJECT,
+                    properties={
+                        "pattern": _Schema(
+                            type=_Type.STRING,
+                            description="Pattern to search for"
+                        ),
+                        "file_path": _Schema(
+                            type=_Type.STRING,
+                            description="File or directory to search in (default: '.')"
+                        ),
+                        "case_sensitive": _Schema(
+                            type=_Type.BOOLEAN,
+                            description="Whether search is case sensitive (default: False)"
+                        ),
+                        "max_lines": _Schema(
+                            type=_Type.INTEGER,
+                            description="Maximum number of result lines to return (default: 50)"
+                        )
+                    },
+                    required=["pattern"]
+                )
             )
-        )
+        return copy.copy(self._declaration)
 
     async def run_async(
         self, *, args: Dict[str, Any], tool_context: ToolContext
@@ -210,19 +646,76 @@ class AgentOsGrepTool(BaseTool):
             return {"error": "pattern is required"}
 
         try:
-            cmd = ["grep", "-n"]
+            # Ask for one extra match so truncation can still be detected.
+            max_count = str(max_lines + 1)
+            is_dir = os.path.isdir(file_path)
+            if _RG:
+                # Spread directory searches over every core; a single file
+                # is not worth the thread start-up.
+                threads = str(_CPU_COUNT) if is_dir else "1"
+                cmd = [
+                    _RG, "--line-number", "--no-heading", "--color=never",
+                    "--max-columns=200", "--max-filesize=5M",
+                    "-m", max_count, "--threads", threads,
+                ]
+                if not _REGEX_META_RE.search(pattern):
+                    cmd.append("--fixed-strings")
+            else:
+                # -I skips binary files after peeking at their first block.
+                cmd = [_GREP, "-n", "-I", "-m", max_count]
+                if is_dir:
+                    cmd.extend([
+                        "-r", "--exclude-dir=.git", "--exclude-dir=node_modules",
+                    ])
             if not case_sensitive:
                 cmd.append("-i")
-            cmd.extend([pattern, file_path])
-
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=30
+            cmd.extend(["-e", pattern, file_path])
+
+            # Stream matches and stop the search once max_lines is
+            # exceeded, rather than buffering everything it prints.
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            
-            lines = result.stdout.strip().split("\n") if result.stdout.strip() else []
-            if lines and lines[0] == "":
-                lines = lines[1:]
-            
+            lines = []
+
+            async def collect():
+                # Split lines by hand from bounded reads: a StreamReader
+                # line iterator raises on lines longer than its limit.
+                pending = bytearray()
+                while True:
+                    chunk = await proc.stdout.read(_STREAM_CHUNK_BYTES)
+                    if not chunk:
+                        if pending:
+                            lines.append(pending.decode(errors="replace"))
+                        return
+                    *complete, rest = chunk.split(b"\n")
+                    for part in complete:
+                        pending += part
+                        lines.append(
+                            pending[:_STREAM_LINE_LIMIT].decode(errors="replace")
+                        )
+                        pending.clear()
+                        if len(lines) > max_lines:
+                            return
+                    pending += rest
+                    # Keep only the head of an overlong line.
+                    del pending[_STREAM_LINE_LIMIT:]
+
+            try:
+                await asyncio.wait_for(collect(), timeout=30)
+            except asyncio.TimeoutError:
+                return {"error": "Search timed out"}
+            finally:
+                # Reap the search however collection ended: past max_lines,
+                # on timeout or on error. After EOF its output is complete,
+                # so killing a child that is still exiting loses nothing.
+                if proc.returncode is None:
+                    with contextlib.suppress(ProcessLookupError):
+                        proc.kill()
+                await proc.wait()
+
             # Limit results
             if len(lines) > max_lines:
                 lines = lines[:max_lines]
@@ -237,8 +730,6 @@ class AgentOsGrepTool(BaseTool):
                 "total_matches": len(lines),
                 "truncated": truncated,
             }
-        except subprocess.TimeoutExpired:
-            return {"error": "Search timed out"}
         except Exception as e:
             return {"error": f"Error searching: {str(e)}"}
 
@@ -252,31 +743,34 @@ class AgentOsGlobTool(BaseTool):
             description="Find files matching a glob pattern. Use this to discover files in the project.",
         )
 
-    def _get_declaration(self) -> Optional['types.FunctionDeclaration']:
+    _declaration = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
         """Get function declaration for the LLM."""
-        from google.genai import types
-        return types.FunctionDeclaration(
-            name="glob_search",
-            description="Find files matching a glob pattern. Use this to discover files in the project.",
-            parameters=types.Schema(
-                type=types.Type.OBJECT,
-                properties={
-                    "pattern": types.Schema(
-                        type=types.Type.STRING,
-                        description="Glob pattern to match files (e.g., '*.py', '**/*.md')"
-                    ),
-                    "directory": types.Schema(
-                        type=types.Type.STRING,
-                        description="Directory to search in (default: '.')"
-                    ),
-                    "max_files": types.Schema(
-                        type=types.Type.INTEGER,
-                        description="Maximum number of files to return (default: 100)"
-                    )
-                },
-                required=["pattern"]
+        if self._declaration is None:
+            type(self)._declaration = _FunctionDeclaration(
+                name="glob_search",
+                description="Find files matching a glob pattern. Use this to discover files in the project.",
+                parameters=_Schema(
+                    type=_Type.OBJECT,
+                    properties={
+                        "pattern": _Schema(
+                            type=_Type.STRING,
+                            description="Glob pattern to match files (e.g., '*.py', '**/*.md')"
+                        ),
+                        "directory": _Schema(
+                            type=_Type.STRING,
+                            description="Directory to search in (default: '.')"
+                        ),
+                        "max_files": _Schema(
+                            type=_Type.INTEGER,
+                            description="Maximum number of files to return (default: 100)"
+                        )
+                    },
+                    required=["pattern"]
+                )
             )
-        )
+        return copy.copy(self._declaration)
 
     async def run_async(
         self, *, args: Dict[str, Any], tool_context: ToolContext
@@ -289,10 +783,10 @@ class AgentOsGlobTool(BaseTool):
             return {"error": "pattern is required"}
 
         try:
-            from glob import glob
-            
-            search_path = os.path.join(directory, pattern)
-            files = glob(search_path, recursive=True)
+            # Walk only until one file past the limit has been found.
+            files = await asyncio.to_thread(
+                _scandir_glob, directory, pattern, max_files + 1
+            )
             
             # Limit results
             if len(files) > max_files:
@@ -321,31 +815,34 @@ class AgentOsBashTool(BaseTool):
             description="Execute bash commands. Use this to run shell commands, git operations, and other system tasks.",
         )
 
-    def _get_declaration(self) -> Optional['types.FunctionDeclaration']:
+    _declaration = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
         """Get function declaration for the LLM."""
-        from google.genai import types
-        return types.FunctionDeclaration(
-            name="bash_command",
-            description="Execute bash commands. Use this to run shell commands, git operations, and other system tasks.",
-            parameters=types.Schema(
-                type=types.Type.OBJECT,
-                properties={
-                    "command": types.Schema(
-                        type=types.Type.STRING,
-                        description="Bash command to execute"
-                    ),
-                    "working_directory": types.Schema(
-                        type=types.Type.STRING,
-                        description="Directory to run command in (default: '.')"
-                    ),
-                    "timeout": types.Schema(
-                        type=types.Type.INTEGER,
-                        description="Timeout in seconds (default: 60)"
-                    )
-                },
-                required=["command"]
+        if self._declaration is None:
+            type(self)._declaration = _FunctionDeclaration(
+                name="bash_command",
+                description="Execute bash commands. Use this to run shell commands, git operations, and other system tasks.",
+                parameters=_Schema(
+                    type=_Type.OBJECT,
+                    properties={
+                        "command": _Schema(
+                            type=_Type.STRING,
+                            description="Bash command to execute"
+                        ),
+                        "working_directory": _Schema(
+                            type=_Type.STRING,
+                            description="Directory to run command in (default: '.')"
+                        ),
+                        "timeout": _Schema(
+                            type=_Type.INTEGER,
+                            description="Timeout in seconds (default: 60)"
+                        )
+                    },
+                    required=["command"]
+                )
             )
-        )
+        return copy.copy(self._declaration)
 
     async def run_async(
         self, *, args: Dict[str, Any], tool_context: ToolContext
@@ -358,26 +855,37 @@ class AgentOsBashTool(BaseTool):
             return {"error": "command is required"}
 
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=working_directory,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+            # Plain commands are exec'd directly; anything needing shell
+            # syntax still goes through bash, as do builtins such as cd or
+            # export that have no executable to exec.
+            result = None
+            argv = _simple_argv(command)
+            if argv is not None:
+                with contextlib.suppress(FileNotFoundError, PermissionError):
+                    result = await _run(
+                        argv, cwd=working_directory, timeout=timeout
+                    )
+            if result is None:
+                result = await _run(
+                    command, cwd=working_directory, timeout=timeout, shell=True
+                )
+            return_code, stdout, stderr, truncated_output = result
             
             return {
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "return_code": result.returncode,
+                "stdout": stdout,
+                "stderr": stderr,
+                "return_code": return_code,
+                "truncated_output": truncated_output,
                 "command": command,
                 "working_directory": working_directory,
             }
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return {"error": f"Command timed out after {timeout} seconds"}
         except Exception as e:
             return {"error": f"Error executing command: {str(e)}"}
+        finally:
+            # The command may have changed any file, even if it failed.
+            _READ_CACHE.clear()
 
 
 class AgentOsTransferTool(BaseTool):
@@ -389,23 +897,26 @@ class AgentOsTransferTool(BaseTool):
             description="Transfer control to another agent. Use this when you have completed your task and need to return control to the main agent or transfer to another specialized agent.",
         )
 
-    def _get_declaration(self) -> Optional['types.FunctionDeclaration']:
+    _declaration = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
         """Get function declaration for the LLM."""
-        from google.genai import types
-        return types.FunctionDeclaration(
-            name="transfer_to_agent",
-            description="Transfer control to another agent. Use this when you have completed your task and need to return control to the main agent or transfer to another specialized agent.",
-            parameters=types.Schema(
-                type=types.Type.OBJECT,
-                properties={
-                    "agent_name": types.Schema(
-                        type=types.Type.STRING,
-                        description="Name of the agent to transfer control to. Use 'agent_os_agent' to return to main agent."
-                    )
-                },
-                required=["agent_name"]
+        if self._declaration is None:
+            type(self)._declaration = _FunctionDeclaration(
+                name="transfer_to_agent",
+                description="Transfer control to another agent. Use this when you have completed your task and need to return control to the main agent or transfer to another specialized agent.",
+                parameters=_Schema(
+                    type=_Type.OBJECT,
+                    properties={
+                        "agent_name": _Schema(
+                            type=_Type.STRING,
+                            description="Name of the agent to transfer control to. Use 'agent_os_agent' to return to main agent."
+                        )
+                    },
+                    required=["agent_name"]
+                )
             )
-        )
+        return copy.copy(self._declaration)
 
     async def run_async(
         self, *, args: Dict[str, Any], tool_context: ToolContext
@@ -419,23 +930,45 @@ class AgentOsTransferTool(BaseTool):
         return {"result": f"Transferred control to {agent_name}"}
 
 
+# The tools are stateless, so every toolset shares one set of instances. A
+# tuple keeps callers from mutating that shared set.
+# Tool classes in the order the toolset lists them. Each toolset builds its
+# own instances, so nothing one toolset does to its tools reaches another.
+_TOOL_CLASSES = (
+    AgentOsReadTool,
+    AgentOsWriteTool,
+    AgentOsGrepTool,
+    AgentOsGlobTool,
+    AgentOsBashTool,
+    AgentOsTransferTool,
+    AgentOsBatchReadTool,
+)
+
+
 class AgentOsToolset(BaseToolset):
     """Toolset containing all Agent OS tools."""
 
-    def __init__(self):
-        super().__init__()
-        self.tools = [
-            AgentOsReadTool(),
-            AgentOsWriteTool(),
-            AgentOsGrepTool(),
-            AgentOsGlobTool(),
-            AgentOsBashTool(),
-            AgentOsTransferTool(),
-        ]
-
-    async def get_tools(self, readonly_context=None) -> List[BaseTool]:
+    def __init__(
+        self,
+        tool_filter: Optional[Union[ToolPredicate, List[str]]] = None,
+    ):
+        super().__init__(tool_filter=tool_filter)
+        tools = tuple(tool_cls() for tool_cls in _TOOL_CLASSES)
+        if tool_filter and isinstance(tool_filter, list):
+            # A name list never depends on the context, so apply it once
+            # here rather than on every request.
+            tools = tuple(t for t in tools if t.name in tool_filter)
+        self.tools = tools
+
+    async def get_tools(self, readonly_context=None) -> Tuple[BaseTool, ...]:
         """Return all tools in this toolset."""
-        return self.tools
+        if not self.tool_filter or isinstance(self.tool_filter, list):
+            return self.tools
+        return tuple(
+            tool
+            for tool in self.tools
+            if self._is_tool_selected(tool, readonly_context)
+        )
 
     @classmethod
     def from_config(cls, config, config_abs_path: str):
@@ -452,6 +985,13 @@ class AgentOsToolset(BaseToolset):
 
 
 # Convenience function to create the toolset
-def create_agent_os_toolset() -> AgentOsToolset:
-    """Create an Agent OS toolset with all available tools."""
-    return AgentOsToolset()
+def create_agent_os_toolset(
+    tool_filter: Optional[Union[ToolPredicate, List[str]]] = None,
+) -> AgentOsToolset:
+    """Create an Agent OS toolset with all available tools.
+
+    Args:
+        tool_filter: Names of the tools to include, or a predicate deciding
+            per request; all tools when omitted.
+    """
+    return AgentOsToolset(tool_filter=tool_filter)
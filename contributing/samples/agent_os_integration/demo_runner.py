@@ -7,18 +7,37 @@ for Agent OS basic integration workflows with actual execution.
 import sys
 import os
 import asyncio
+import atexit
+import functools
+import traceback
 from pathlib import Path
+from types import SimpleNamespace
 
-# Import ADK with robust path handling
-try:
-    # Try direct import first (when ADK is properly installed)
-    from google.adk.runners import InMemoryRunner
-    from google.genai import types
-    from google.adk.agents.config_agent_utils import from_config
-except ImportError:
-    # Fallback: Add ADK source directory only if direct import fails
-    adk_src_path = Path(__file__).parent.parent.parent.parent / "src"
-    if adk_src_path.exists():
+# Paths used by the demos, resolved once at import
+_HERE = Path(__file__).parent
+_PYTHON_DIR = _HERE / "python"
+_YAML_AGENT_PATH = str(_HERE / "yaml_agent" / "root_agent.yaml")
+
+@functools.lru_cache(maxsize=1)
+def _lazy_adk():
+    """Import the ADK modules used by the demos on first use.
+
+    Deferring these imports keeps the heavy ADK/genai import graph off the
+    startup path until a demo actually needs a runner or a YAML agent.
+    """
+    try:
+        # Try direct import first (when ADK is properly installed)
+        from google.adk.runners import InMemoryRunner
+        from google.genai import types
+        from google.adk.agents.config_agent_utils import from_config
+    except ImportError:
+        # Fallback: Add ADK source directory only if direct import fails
+        adk_src_path = _HERE.parent.parent.parent / "src"
+        if not adk_src_path.exists():
+            raise ImportError(
+                f"ADK source directory not found at {adk_src_path}. "
+                f"Please ensure ADK is installed or set PYTHONPATH correctly."
+            )
         sys.path.insert(0, str(adk_src_path))
         try:
             from google.adk.runners import InMemoryRunner
@@ -29,11 +48,9 @@ except ImportError:
                 f"Could not import ADK modules. Please ensure ADK is installed or "
                 f"PYTHONPATH includes the ADK source directory. Error: {e}"
             ) from e
-    else:
-        raise ImportError(
-            f"ADK source directory not found at {adk_src_path}. "
-            f"Please ensure ADK is installed or set PYTHONPATH correctly."
-        )
+    return SimpleNamespace(
+        InMemoryRunner=InMemoryRunner, types=types, from_config=from_config
+    )
 
 
 def get_agent_os_path():
@@ -48,282 +65,425 @@ def get_agent_os_model():
     return os.environ.get("AGENT_OS_MODEL", "iflow/Qwen3-Coder")
 
 
+@functools.lru_cache(maxsize=1)
+def _get_agent_os_agent_cls():
+    """Import AgentOsAgent, adding the python/ directory to sys.path at most once."""
+    if not _PYTHON_DIR.exists():
+        raise ImportError(f"Python agent directory not found at {_PYTHON_DIR}")
+    if str(_PYTHON_DIR) not in sys.path:
+        sys.path.insert(0, str(_PYTHON_DIR))
+    from agent_os_agent import AgentOsAgent
+    return AgentOsAgent
+
+
+@functools.lru_cache(maxsize=4)
+def _build_agent_os_agent(agent_os_path, project_path, name, model):
+    """Build a configured AgentOsAgent (with subagents) once per configuration."""
+    AgentOsAgent = _get_agent_os_agent_cls()
+    agent_os_agent = AgentOsAgent.create_with_agent_os(
+        agent_os_path=agent_os_path,
+        project_path=project_path,
+        name=name,
+        model=model,
+    )
+    agent_os_agent.add_agent_os_subagents(agent_os_path)
+    return agent_os_agent
+
+
+def _get_python_agent():
+    """Return the Python demo agent for the current environment settings."""
+    return _build_agent_os_agent(
+        get_agent_os_path(), ".", "agent_os_agent", get_agent_os_model()
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_agent(config_path):
+    """Load a YAML agent config once per path and reuse the agent."""
+    return _lazy_adk().from_config(config_path)
+
+
+# Runners keyed by id() of their (cached, long-lived) agent; the runner keeps
+# a reference to the agent, so the id cannot be reused while cached.
+_RUNNERS = {}
+
+
+def _get_runner(agent):
+    """Return the InMemoryRunner for an agent, creating it on first use."""
+    runner = _RUNNERS.get(id(agent))
+    if runner is None:
+        runner = _RUNNERS[id(agent)] = _lazy_adk().InMemoryRunner(agent)
+    return runner
+
+
+# User id for all demo sessions.
+_USER_ID = "demo_user"
+
+# Content role of events produced by the model.
+_MODEL_ROLE = "model"
+
+# Maximum number of prompts sent to the model provider at the same time.
+_MAX_CONCURRENT_PROMPTS = 2
+
+# Shared event loop so consecutive prompts don't pay loop setup/teardown.
+_LOOP = None
+
+
+def _get_loop():
+    """Return the shared event loop, creating it on first use."""
+    global _LOOP
+    if _LOOP is None:
+        _LOOP = asyncio.new_event_loop()
+        atexit.register(_close_loop)
+    return _LOOP
+
+
+def _close_loop():
+    """Finalize async generators and the default executor, then close the loop."""
+    if _LOOP is None or _LOOP.is_closed():
+        return
+    try:
+        _LOOP.run_until_complete(_LOOP.shutdown_asyncgens())
+        _LOOP.run_until_complete(_LOOP.shutdown_default_executor())
+    finally:
+        _LOOP.close()
+
+
+# "Commands supported" block shared by both agent demos.
+_COMMANDS_SUPPORTED = "\n".join([
+    "\n📝 Agent OS Commands supported:",
+    "   • @plan-product - Analyze and plan product development",
+    "   • @create-spec - Create detailed technical specifications",
+    "   • @create-tasks - Break down specs into actionable tasks",
+    "   • @execute-tasks - Execute development tasks systematically",
+]) + "\n"
+
+
+def _write_lines(*lines):
+    """Write a block of lines to stdout with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _preview(text, limit=500):
+    """Return at most ``limit`` characters of ``text``, marking truncation."""
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}..."
+
+
+async def _create_session(runner, session_suffix):
+    """Create the demo session used for ``session_suffix`` on ``runner``."""
+    await runner.session_service.create_session(
+        app_name=runner.app_name,
+        user_id=_USER_ID,
+        session_id=f"demo_session_{session_suffix}"
+    )
+
+
+async def _run_prompt(runner, prompt, session_suffix="demo", create_session=True):
+    """Run an agent with a prompt on the current loop and return the response."""
+    user_id = _USER_ID
+    session_id = f"demo_session_{session_suffix}"
+    types = _lazy_adk().types
+    message = types.Content(parts=[types.Part(text=prompt)])
+    
+    # Create session first unless the caller already did
+    if create_session:
+        await _create_session(runner, session_suffix)
+    
+    # Inspect events as they stream in and keep only the latest model text.
+    # Events are authored by the agent name, so match on the content role, and
+    # skip function-call parts which carry no text.
+    last_text = None
+    async for event in runner.run_async(
+        user_id=user_id,
+        session_id=session_id,
+        new_message=message
+    ):
+        content = event.content
+        if content is None or content.role != _MODEL_ROLE or not content.parts:
+            continue
+        text = content.parts[0].text
+        if text:
+            last_text = text
+
+    return last_text or "No model response found"
+
+
+async def _run_prompts(jobs, workers=_MAX_CONCURRENT_PROMPTS):
+    """Run ``(runner, prompt, session_suffix)`` jobs with a pool of workers.
+
+    At most ``workers`` coroutines pull jobs from one shared iterator, which
+    keeps that many prompts in flight without a lock. Returns a dict mapping
+    each session suffix to its response, or to the exception the job raised.
+    """
+    results = {}
+    
+    # Create every session up front in one batch before dispatching prompts
+    created = await asyncio.gather(
+        *(_create_session(runner, suffix) for runner, _, suffix in jobs),
+        return_exceptions=True,
+    )
+    pending = []
+    for job, error in zip(jobs, created):
+        if isinstance(error, Exception):
+            results[job[2]] = error
+        else:
+            pending.append(job)
+    remaining = iter(pending)
+    
+    async def worker():
+        # Taking the next job never awaits, so workers never take the same one
+        for runner, prompt, suffix in remaining:
+            try:
+                results[suffix] = await _run_prompt(
+                    runner, prompt, suffix, create_session=False
+                )
+            except Exception as e:
+                results[suffix] = e
+    
+    await asyncio.gather(
+        *(worker() for _ in range(min(workers, len(pending))))
+    )
+    return results
+
+
 def run_agent_with_prompt(runner, prompt, session_suffix="demo"):
     """Helper function to run an agent with a prompt and return the response."""
-    async def create_and_run():
-        user_id = "demo_user"
-        session_id = f"demo_session_{session_suffix}"
-        message = types.Content(parts=[types.Part(text=prompt)])
-        
-        # Create session first
-        await runner.session_service.create_session(
-            app_name=runner.app_name,
-            user_id=user_id,
-            session_id=session_id
-        )
-        
-        events = []
-        async for event in runner.run_async(
-            user_id=user_id,
-            session_id=session_id,
-            new_message=message
-        ):
-            events.append(event)
-        
-        # Get the final response
-        for event in events:
-            if event.author == 'model' and event.content and event.content.parts:
-                return event.content.parts[0].text
-        
-        return "No model response found"
-    
-    return asyncio.run(create_and_run())
+    return _get_loop().run_until_complete(
+        _run_prompt(runner, prompt, session_suffix)
+    )
 
 
-def demo_python_agent():
+async def demo_python_agent():
     """Demo the Python agent implementation with actual execution."""
-    print("🐍 Testing Python Agent (AgentOsAgent)")
-    print("-" * 50)
+    _write_lines("🐍 Testing Python Agent (AgentOsAgent)", "-" * 50)
     
     try:
-        # Import python agent with better error handling
-        python_dir = Path(__file__).parent / "python"
-        if python_dir.exists():
-            sys.path.insert(0, str(python_dir))
-            from agent_os_agent import AgentOsAgent
-        else:
-            raise ImportError(f"Python agent directory not found at {python_dir}")
-        
-        print(f"✅ Python agent loaded successfully")
+        # Create Agent OS Agent with its subagents
+        agent_os_agent = _get_python_agent()
         
-        # Create Agent OS Agent
-        agent_os_agent = AgentOsAgent.create_with_agent_os_config(
-            agent_os_path=get_agent_os_path(),
-            project_path=".",
-            name="agent_os_agent",
-            model=get_agent_os_model(),
-        )
-        
-        # Add Agent OS subagents
-        agent_os_agent.add_agent_os_subagents(get_agent_os_path())
-        
-        print(f"   Agent name: {agent_os_agent.name}")
-        print(f"   Agent description: {agent_os_agent.description}")
-        print(f"   Number of tools: {len(agent_os_agent.tools)}")
-        print(f"   Number of sub-agents: {len(agent_os_agent.sub_agents)}")
+        lines = [
+            "✅ Python agent loaded successfully",
+            f"   Agent name: {agent_os_agent.name}",
+            f"   Agent description: {agent_os_agent.description}",
+            f"   Number of tools: {len(agent_os_agent.tools)}",
+            f"   Number of sub-agents: {len(agent_os_agent.sub_agents)}",
+        ]
         
         # Show available tools
-        print(f"   Available tools:")
+        lines.append("   Available tools:")
         for i, tool in enumerate(agent_os_agent.tools):
             if hasattr(tool, 'tools'):
                 for j, sub_tool in enumerate(tool.tools):
                     tool_name = getattr(sub_tool, '__name__', str(sub_tool))
-                    print(f"     {i+1}.{j+1}. {tool_name}")
+                    lines.append(f"     {i+1}.{j+1}. {tool_name}")
             else:
                 tool_name = getattr(tool, '__name__', str(tool))
-                print(f"     {i+1}. {tool_name}")
+                lines.append(f"     {i+1}. {tool_name}")
         
         # Show sub-agents
         if agent_os_agent.sub_agents:
-            print(f"   Sub-agents:")
+            lines.append("   Sub-agents:")
             for i, sub_agent in enumerate(agent_os_agent.sub_agents):
-                print(f"     {i+1}. {sub_agent.name}")
+                lines.append(f"     {i+1}. {sub_agent.name}")
         
-        print(f"\n📝 Agent OS Commands supported:")
-        print(f"   • @plan-product - Analyze and plan product development")
-        print(f"   • @create-spec - Create detailed technical specifications")
-        print(f"   • @create-tasks - Break down specs into actionable tasks")
-        print(f"   • @execute-tasks - Execute development tasks systematically")
+        _write_lines(*lines)
+        sys.stdout.write(_COMMANDS_SUPPORTED)
         
         # Test Runner integration with actual execution
-        print(f"\n🤖 Testing Runner Integration with Live Execution:")
+        print("\n🤖 Testing Runner Integration with Live Execution:")
         try:
-            runner = InMemoryRunner(agent_os_agent)
-            print(f"✅ InMemoryRunner created successfully")
-            print(f"   App name: {runner.app_name}")
-            print(f"   Agent: {runner.agent.name}")
+            runner = _get_runner(agent_os_agent)
             
             # Execute a real prompt
             prompt = "@plan-product for a simple calculator app with basic arithmetic operations"
-            print(f"\n📝 Executing prompt: {prompt}")
-            print(f"🔄 Running agent...")
+            _write_lines(
+                "✅ InMemoryRunner created successfully",
+                f"   App name: {runner.app_name}",
+                f"   Agent: {runner.agent.name}",
+                f"\n📝 Executing prompt: {prompt}",
+                "🔄 Running agent...",
+            )
             
-            response = run_agent_with_prompt(runner, prompt, "python_demo")
-            print(f"\n✅ Agent Response:")
-            print(f"📄 {response}")
+            response = await _run_prompt(runner, prompt, "python_demo")
+            _write_lines("\n✅ Python Agent Response:", f"📄 {response}")
             
         except Exception as e:
             print(f"⚠️  Execution failed: {e}")
-            import traceback
             traceback.print_exc()
         
         return True
         
     except Exception as e:
         print(f"❌ Error loading Python agent: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
-def demo_yaml_agent():
+async def demo_yaml_agent():
     """Demo the YAML agent implementation with actual execution."""
-    print("\n📄 Testing YAML Agent (LlmAgent with Agent OS tools)")
-    print("-" * 50)
+    _write_lines(
+        "\n📄 Testing YAML Agent (LlmAgent with Agent OS tools)", "-" * 50
+    )
     
     try:
         # Load YAML agent
-        yaml_agent_path = Path(__file__).parent / "yaml_agent" / "root_agent.yaml"
-        agent = from_config(str(yaml_agent_path))
+        agent = _load_yaml_agent(_YAML_AGENT_PATH)
         
-        print(f"✅ YAML agent loaded successfully")
-        print(f"   Agent name: {agent.name}")
-        print(f"   Agent description: {agent.description}")
-        print(f"   Number of tools: {len(agent.tools)}")
-        print(f"   Number of sub-agents: {len(agent.sub_agents)}")
+        lines = [
+            "✅ YAML agent loaded successfully",
+            f"   Agent name: {agent.name}",
+            f"   Agent description: {agent.description}",
+            f"   Number of tools: {len(agent.tools)}",
+            f"   Number of sub-agents: {len(agent.sub_agents)}",
+        ]
         
         # Show available tools
-        print(f"   Available tools:")
+        lines.append("   Available tools:")
         for i, tool in enumerate(agent.tools):
             tool_name = getattr(tool, '__name__', str(tool))
-            print(f"     {i+1}. {tool_name}")
+            lines.append(f"     {i+1}. {tool_name}")
         
         # Show sub-agents
         if agent.sub_agents:
-            print(f"   Sub-agents:")
+            lines.append("   Sub-agents:")
             for i, sub_agent in enumerate(agent.sub_agents):
-                print(f"     {i+1}. {sub_agent.name}")
+                lines.append(f"     {i+1}. {sub_agent.name}")
         
-        print(f"\n📝 Agent OS Commands supported:")
-        print(f"   • @plan-product - Analyze and plan product development")
-        print(f"   • @create-spec - Create detailed technical specifications")
-        print(f"   • @create-tasks - Break down specs into actionable tasks")
-        print(f"   • @execute-tasks - Execute development tasks systematically")
+        _write_lines(*lines)
+        sys.stdout.write(_COMMANDS_SUPPORTED)
         
         # Test Runner integration with actual execution
-        print(f"\n🤖 Testing Runner Integration with Live Execution:")
+        print("\n🤖 Testing Runner Integration with Live Execution:")
         try:
-            runner = InMemoryRunner(agent)
-            print(f"✅ InMemoryRunner created successfully")
-            print(f"   App name: {runner.app_name}")
-            print(f"   Agent: {runner.agent.name}")
+            runner = _get_runner(agent)
             
             # Execute a real prompt
             prompt = "@create-spec for user authentication with login and registration features"
-            print(f"\n📝 Executing prompt: {prompt}")
-            print(f"🔄 Running agent...")
+            _write_lines(
+                "✅ InMemoryRunner created successfully",
+                f"   App name: {runner.app_name}",
+                f"   Agent: {runner.agent.name}",
+                f"\n📝 Executing prompt: {prompt}",
+                "🔄 Running agent...",
+            )
             
-            response = run_agent_with_prompt(runner, prompt, "yaml_demo")
-            print(f"\n✅ Agent Response:")
-            print(f"📄 {response}")
+            response = await _run_prompt(runner, prompt, "yaml_demo")
+            _write_lines("\n✅ YAML Agent Response:", f"📄 {response}")
             
         except Exception as e:
             print(f"⚠️  Execution failed: {e}")
-            import traceback
             traceback.print_exc()
         
         return True
         
     except Exception as e:
         print(f"❌ Error loading YAML agent: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
-
-
-def demo_comparative_execution():
+async def demo_comparative_execution():
     """Demo showing both agents executing the same task."""
-    print("\n🔄 Comparative Agent Execution Demo")
-    print("=" * 60)
-    
-    print("Testing both agents with the same task to compare responses:")
-    
     # Test both agents with the same prompt
     test_prompt = "@analyze-project and suggest improvements for this Agent OS integration"
-    print(f"\n📋 Test Prompt: {test_prompt}")
-    print("\n" + "=" * 60)
+    _write_lines(
+        "\n🔄 Comparative Agent Execution Demo",
+        "=" * 60,
+        "Testing both agents with the same task to compare responses:",
+        f"\n📋 Test Prompt: {test_prompt}",
+        "\n" + "=" * 60,
+    )
     
-    # Python Agent Test
-    print("\n🐍 Python Agent (AgentOsAgent) Response:")
-    print("-" * 40)
+    # Build both runners up front so their prompts can run concurrently
+    runs = []
     try:
-        sys.path.insert(0, str(Path(__file__).parent / "python"))
-        from agent_os_agent import AgentOsAgent
-        
-        agent_os_agent = AgentOsAgent.create_with_agent_os(
-            name="agent_os_agent",
-            model="iflow/Qwen3-Coder",
-        )
-        agent_os_agent.add_agent_os_subagents(get_agent_os_path())
-        
-        runner = InMemoryRunner(agent_os_agent)
-        response = run_agent_with_prompt(runner, test_prompt, "compare_python")
-        print(f"📄 Response ({len(response)} chars):")
-        print(response[:500] + "..." if len(response) > 500 else response)
-        
+        runner = _get_runner(_get_python_agent())
+        runs.append(("🐍 Python Agent (AgentOsAgent)", runner, "compare_python"))
     except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
+        print(f"❌ Python Agent Error: {e}")
         traceback.print_exc()
     
-    # YAML Agent Test
-    print(f"\n📄 YAML Agent (LlmAgent) Response:")
-    print("-" * 40)
     try:
-        yaml_agent_path = Path(__file__).parent / "yaml_agent" / "root_agent.yaml"
-        yaml_agent = from_config(str(yaml_agent_path))
-        runner = InMemoryRunner(yaml_agent)
-        
-        response = run_agent_with_prompt(runner, test_prompt, "compare_yaml")
-        print(f"📄 Response ({len(response)} chars):")
-        print(response[:500] + "..." if len(response) > 500 else response)
-        
+        runner = _get_runner(_load_yaml_agent(_YAML_AGENT_PATH))
+        runs.append(("📄 YAML Agent (LlmAgent)", runner, "compare_yaml"))
     except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
+        print(f"❌ YAML Agent Error: {e}")
         traceback.print_exc()
+    
+    results = await _run_prompts(
+        [(runner, test_prompt, suffix) for _, runner, suffix in runs]
+    )
+    
+    for label, _, suffix in runs:
+        response = results[suffix]
+        _write_lines(f"\n{label} Response:", "-" * 40)
+        if isinstance(response, Exception):
+            print(f"❌ Error: {response}")
+            traceback.print_exception(
+                type(response), response, response.__traceback__
+            )
+            continue
+        _write_lines(f"📄 Response ({len(response)} chars):", _preview(response))
+
+
+async def _run_agent_demos():
+    """Run the Python and YAML agent demos concurrently on the current loop."""
+    return await asyncio.gather(demo_python_agent(), demo_yaml_agent())
 
 
 def main():
     """Main demo function."""
-    print("🚀 Agent OS Basic Integration Demo with Live Execution")
-    print("=" * 60)
-    print("This demo shows Python and YAML agents executing real prompts")
-    print("using the iflow/Qwen3-Coder model.\n")
+    # Use uvloop for the shared event loop when it is available
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    _write_lines(
+        "🚀 Agent OS Basic Integration Demo with Live Execution",
+        "=" * 60,
+        "This demo shows Python and YAML agents executing real prompts",
+        "using the iflow/Qwen3-Coder model.\n",
+    )
     
-    # Test individual agents with execution
-    python_success = demo_python_agent()
-    yaml_success = demo_yaml_agent()
+    # Test individual agents with execution; their LLM calls overlap
+    loop = _get_loop()
+    python_success, yaml_success = loop.run_until_complete(_run_agent_demos())
     
     # Show comparative execution if both work
     if python_success and yaml_success:
-        demo_comparative_execution()
+        loop.run_until_complete(demo_comparative_execution())
     
     # Summary
-    print("\n" + "=" * 60)
-    print("📊 Demo Summary:")
-    print(f"   Python Agent (AgentOsAgent): {'✅ Working' if python_success else '❌ Failed'}")
-    print(f"   YAML Agent (LlmAgent): {'✅ Working' if yaml_success else '❌ Failed'}")
+    lines = [
+        "\n" + "=" * 60,
+        "📊 Demo Summary:",
+        f"   Python Agent (AgentOsAgent): {'✅ Working' if python_success else '❌ Failed'}",
+        f"   YAML Agent (LlmAgent): {'✅ Working' if yaml_success else '❌ Failed'}",
+    ]
     
     if python_success or yaml_success:
-        print("\n🎉 At least one agent successfully executed Agent OS workflows!")
-        print("\n💡 Available Agent OS Commands:")
-        print("   • @plan-product - Analyze and plan product development")
-        print("   • @create-spec - Create detailed technical specifications")
-        print("   • @create-tasks - Break down specs into actionable tasks")
-        print("   • @execute-tasks - Execute development tasks systematically")
-        print("   • @execute-task - Execute a specific task")
-        
-        print("\n🔧 Next Steps:")
-        print("   1. Try running: python demo_runner.py")
-        print("   2. Use ADK CLI: adk run python/")
-        print("   3. Use ADK CLI: adk run yaml_agent/")
-        print("   4. Use ADK CLI: adk run yaml_agent/root_agent_simple.yaml")
-        print("   5. Explore the .agent-os/ directory structure created by the agents")
+        lines += [
+            "\n🎉 At least one agent successfully executed Agent OS workflows!",
+            "\n💡 Available Agent OS Commands:",
+            "   • @plan-product - Analyze and plan product development",
+            "   • @create-spec - Create detailed technical specifications",
+            "   • @create-tasks - Break down specs into actionable tasks",
+            "   • @execute-tasks - Execute development tasks systematically",
+            "   • @execute-task - Execute a specific task",
+            "\n🔧 Next Steps:",
+            "   1. Try running: python demo_runner.py",
+            "   2. Use ADK CLI: adk run python/",
+            "   3. Use ADK CLI: adk run yaml_agent/",
+            "   4. Use ADK CLI: adk run yaml_agent/root_agent_simple.yaml",
+            "   5. Explore the .agent-os/ directory structure created by the agents",
+        ]
     else:
-        print("\n❌ All agents failed. Check the error messages above.")
+        lines.append("\n❌ All agents failed. Check the error messages above.")
+    _write_lines(*lines)
     
     return 0 if (python_success or yaml_success) else 1
 
@@ -21,31 +21,64 @@ from google.adk.runners import InMemoryRunner
 from google.genai import types
 
 
-def get_agent_os_path():
-    """Get Agent OS path from environment or use default."""
-    # Default to .agent-os directory (users install agent-os here)
-    default_path = ".agent-os"
-    return os.environ.get("AGENT_OS_PATH", default_path)
+# Default to .agent-os directory (users install agent-os here)
+AGENT_OS_PATH = os.environ.get("AGENT_OS_PATH", ".agent-os")
+AGENT_OS_MODEL = os.environ.get("AGENT_OS_MODEL", "iflow/Qwen3-Coder")
 
 
-def get_agent_os_model():
-    """Get Agent OS model from environment or use default."""
-    return os.environ.get("AGENT_OS_MODEL", "iflow/Qwen3-Coder")
+# Events are written in batches of this many to cut per-event stdout writes.
+_EVENT_BATCH = 16
+
+_EXAMPLES = (
+    (
+        "📋 Example 1: Planning a new product",
+        "session1",
+        "I want to plan a new task management application. Can you help me create the product documentation using Agent OS workflows?",
+    ),
+    (
+        "📝 Example 2: Creating a specification",
+        "session2",
+        "Create a spec for user authentication feature with the following requirements: email/password login, password reset, and user registration.",
+    ),
+    (
+        "📁 Example 3: File operations",
+        "session3",
+        "Create a simple Python file called hello.py with a hello world function and run it to test.",
+    ),
+)
+
+
+async def run_example(runner, title, session_id, text):
+    """Run one example prompt in its own session and print its events."""
+    sys.stdout.write(f"\n{title}\n{'-' * 30}\nProcessing request...\n")
+    buf = []
+    async for event in runner.run_async(
+        user_id="user1",
+        session_id=session_id,
+        new_message=types.Content(parts=[types.Part(text=text)])
+    ):
+        # Examples run concurrently, so tag each event with its session
+        buf.append(f"[{session_id}] Event: {event}")
+        if len(buf) == _EVENT_BATCH:
+            sys.stdout.write("\n".join(buf) + "\n")
+            buf.clear()
+    if buf:
+        sys.stdout.write("\n".join(buf) + "\n")
 
 
 async def main():
     """Example usage of Agent OS Agent with Agent OS integration."""
     
     # Set up paths
-    agent_os_path = get_agent_os_path()
+    agent_os_path = AGENT_OS_PATH
     project_path = "."
     
     # Create Agent OS Agent with Agent OS configuration
-    agent_os_agent = AgentOsAgent.create_with_agent_os_config(
+    agent_os_agent = AgentOsAgent.create_with_agent_os(
         agent_os_path=agent_os_path,
         project_path=project_path,
         name="agent_os_agent",
-        model=get_agent_os_model(),
+        model=AGENT_OS_MODEL,
     )
     
     # Add Agent OS subagents
@@ -58,58 +91,21 @@ async def main():
     print("🤖 Agent OS Agent with Agent OS Integration")
     print("=" * 50)
     
-    # Create sessions for each example
-    session1 = await runner.session_service.create_session(
-        app_name="InMemoryRunner",
-        user_id="user1",
-        session_id="session1"
-    )
-    session2 = await runner.session_service.create_session(
-        app_name="InMemoryRunner",
-        user_id="user1",
-        session_id="session2"
-    )
-    session3 = await runner.session_service.create_session(
-        app_name="InMemoryRunner",
-        user_id="user1",
-        session_id="session3"
-    )
-    
-    # Example 1: Plan a new product
-    print("\n📋 Example 1: Planning a new product")
-    print("-" * 30)
+    # Create sessions for every example at once
+    await asyncio.gather(*(
+        runner.session_service.create_session(
+            app_name="InMemoryRunner",
+            user_id="user1",
+            session_id=session_id
+        )
+        for _, session_id, _ in _EXAMPLES
+    ))
     
-    print("Processing request...")
-    async for event in runner.run_async(
-        user_id="user1",
-        session_id="session1",
-        new_message=types.Content(parts=[types.Part(text="I want to plan a new task management application. Can you help me create the product documentation using Agent OS workflows?")])
-    ):
-        print(f"Event: {event}")
-    
-    # Example 2: Create a spec
-    print("\n📝 Example 2: Creating a specification")
-    print("-" * 30)
-    
-    print("Processing request...")
-    async for event in runner.run_async(
-        user_id="user1",
-        session_id="session2",
-        new_message=types.Content(parts=[types.Part(text="Create a spec for user authentication feature with the following requirements: email/password login, password reset, and user registration.")])
-    ):
-        print(f"Event: {event}")
-    
-    # Example 3: File operations
-    print("\n📁 Example 3: File operations")
-    print("-" * 30)
-    
-    print("Processing request...")
-    async for event in runner.run_async(
-        user_id="user1",
-        session_id="session3",
-        new_message=types.Content(parts=[types.Part(text="Create a simple Python file called hello.py with a hello world function and run it to test.")])
-    ):
-        print(f"Event: {event}")
+    # The examples use independent sessions, so their model calls overlap
+    await asyncio.gather(*(
+        run_example(runner, title, session_id, text)
+        for title, session_id, text in _EXAMPLES
+    ))
 
 
 if __name__ == "__main__":
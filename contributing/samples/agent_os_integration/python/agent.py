@@ -15,37 +15,30 @@
 """Agent OS Agent configuration for ADK."""
 
 import os
-import sys
-from pathlib import Path
 
-# Add the current directory to Python path
-sys.path.insert(0, str(Path(__file__).parent))
+if __package__:
+    from .agent_os_agent import AgentOsAgent
+else:
+    # Imported as a top-level module with python/ on sys.path, as the
+    # scripts under test/ do.
+    from agent_os_agent import AgentOsAgent
 
-from agent_os_agent import AgentOsAgent
 
-
-def get_agent_os_path():
-    """Get Agent OS path from environment or use default."""
-    # Default to .agent-os directory (users install agent-os here)
-    default_path = ".agent-os"
-    return os.environ.get("AGENT_OS_PATH", default_path)
-
-
-def get_agent_os_model():
-    """Get Agent OS model from environment or use default."""
-    return os.environ.get("AGENT_OS_MODEL", "iflow/Qwen3-Coder")
+# Default to .agent-os directory (users install agent-os here)
+AGENT_OS_PATH = os.environ.get("AGENT_OS_PATH", ".agent-os")
+AGENT_OS_MODEL = os.environ.get("AGENT_OS_MODEL", "iflow/Qwen3-Coder")
 
 
 # Create Agent OS Agent with Agent OS configuration
 agent_os_agent = AgentOsAgent.create_with_agent_os(
-    agent_os_path=get_agent_os_path(),
+    agent_os_path=AGENT_OS_PATH,
     project_path=".",
     name="agent_os_agent",
-    model=get_agent_os_model(),
+    model=AGENT_OS_MODEL,
 )
 
 # Add Agent OS subagents
-agent_os_agent.add_agent_os_subagents(get_agent_os_path())
+agent_os_agent.add_agent_os_subagents(AGENT_OS_PATH)
 
 # For ADK tools compatibility, the root agent must be named `root_agent`
 root_agent = agent_os_agent
@@ -14,79 +14,61 @@
 
 """Agent OS Agent integration for ADK."""
 
-import os
+import functools
+import importlib.util
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-# Import ADK agents - use more robust import method
-try:
-    # Try direct import first (when ADK is properly installed)
-    from google.adk.agents.llm_agent import LlmAgent
-except ImportError:
-    # Fallback: Add src directory only if direct import fails
+from typing import Optional, Sequence
+
+
+def _adk_installed() -> bool:
+    """Return whether google.adk is importable, without importing it."""
+    try:
+        return importlib.util.find_spec("google.adk") is not None
+    except ModuleNotFoundError:
+        # The google namespace package itself is missing.
+        return False
+
+
+def _add_adk_src_dir() -> None:
+    """Put this checkout's src/ directory on sys.path so ADK can be imported."""
     import sys
-    from pathlib import Path as PathLib
-    
-    # Find ADK source directory relative to this file
-    current_dir = PathLib(__file__).parent
-    adk_src_dir = current_dir.parent.parent.parent / "src"
-    
-    if adk_src_dir.exists():
-        sys.path.insert(0, str(adk_src_dir))
-        try:
-            from google.adk.agents.llm_agent import LlmAgent
-        except ImportError as e:
-            raise ImportError(
-                f"Could not import ADK agents. Please ensure ADK is installed or "
-                f"PYTHONPATH includes the ADK source directory. Error: {e}"
-            ) from e
-    else:
+
+    # python/ -> agent_os_integration/ -> samples/ -> contributing/ -> repo
+    adk_src_dir = Path(__file__).resolve().parents[4] / "src"
+    if not adk_src_dir.exists():
         raise ImportError(
             f"ADK source directory not found at {adk_src_dir}. "
             f"Please ensure ADK is installed or set PYTHONPATH correctly."
         )
-try:
-    from ..agent_os_tools import create_agent_os_toolset
-except ImportError:
-    from agent_os_tools import create_agent_os_toolset
+    sys.path.insert(0, str(adk_src_dir))
 
 
-class AgentOsAgent(LlmAgent):
-    """Agent OS Agent that integrates Agent OS workflows with ADK."""
+# Only probe the filesystem for a source checkout when ADK is not installed.
+if not _adk_installed():
+    _add_adk_src_dir()
+from google.adk.agents.llm_agent import LlmAgent
 
-    def __init__(
-        self,
-        name: str = "agent_os",
-        model: str = "iflow/Qwen3-Coder",
-        instruction: str = "",
-        description: str = "A specialized coding agent that follows Agent OS workflows for spec-driven development",
-        **kwargs
-    ):
-        # Default instruction for Agent OS Agent
-        if not instruction:
-            instruction = self._get_default_instruction()
-        
-        # Add Agent OS tools
-        tools = kwargs.get("tools", [])
-        tools.append(create_agent_os_toolset())
-        kwargs["tools"] = tools
 
-        super().__init__(
-            name=name,
-            model=model,
-            instruction=instruction,
-            description=description,
-            **kwargs
-        )
+# Model used by AgentOsAgent, and so by its subagents, unless one is given.
+_DEFAULT_MODEL = "iflow/Qwen3-Coder"
 
-    def _get_default_instruction(self) -> str:
-        """Get the default instruction for Agent OS Agent."""
-        return self._get_default_instruction_static()
-    
-    @staticmethod
-    def _get_default_instruction_static() -> str:
-        """Get the default instruction for Agent OS Agent (static version)."""
-        return """
+# (name, summary) for each tool in the Agent OS toolset, in prompt order.
+_AVAILABLE_TOOLS = (
+    ("read_file", "Read file contents"),
+    ("read_files", "Read several files in one call"),
+    ("write_file", "Create or update files"),
+    ("grep_search", "Search for patterns in files"),
+    ("glob_search", "Find files matching patterns"),
+    ("bash_command", "Execute shell commands"),
+    ("transfer_to_agent", "Transfer control to specialized subagents"),
+)
+
+_AVAILABLE_TOOLS_SECTION = "\n".join(
+    f"- **{name}**: {summary}" for name, summary in _AVAILABLE_TOOLS
+)
+
+# Default instruction shared by every AgentOsAgent instance.
+_DEFAULT_INSTRUCTION = f"""
 You are a specialized coding agent that follows Agent OS workflows for spec-driven development. You help developers build quality software by following structured processes and maintaining high standards.
 
 ## Core Capabilities
@@ -99,12 +81,7 @@ You are a specialized coding agent that follows Agent OS workflows for spec-driv
 
 ## Available Tools
 
-- **read_file**: Read file contents
-- **write_file**: Create or update files
-- **grep_search**: Search for patterns in files
-- **glob_search**: Find files matching patterns
-- **bash_command**: Execute shell commands
-- **transfer_to_agent**: Transfer control to specialized subagents
+{_AVAILABLE_TOOLS_SECTION}
 
 ## Agent OS Commands
 
@@ -172,6 +149,7 @@ Use `transfer_to_agent("subagent_name")` to delegate tasks to these specialists.
 3. **Use Specified Subagents**: Delegate to subagents as defined in the instruction steps
 4. **Apply Standards**: Follow Agent OS conventions from the standards files
 5. **Validate Outputs**: Ensure results match the templates and requirements
+6. **Batch Independent Work**: When several tool calls do not depend on each other's results (for example reading the command file and the standards files, or a grep alongside a glob), request them together in a single response; they are executed concurrently. Use `read_files` rather than repeated `read_file` calls when the paths are already known
 
 ## Workflow Principles
 
@@ -192,112 +170,31 @@ Use `transfer_to_agent("subagent_name")` to delegate tasks to these specialists.
 **Important**: Always read and follow the actual command instruction files from `.adk/commands/` and `.agent-os/instructions/core/` rather than using hardcoded workflows. This ensures you're following the most current and accurate Agent OS processes.
 
 Remember: You are part of a structured development process. Always follow the established command instructions and maintain high quality standards.
-"""
+""".strip()
 
-    @classmethod
-    def create_with_agent_os(
-        cls,
-        agent_os_path: str = ".agent-os",
-        project_path: str = ".",
-        **kwargs
-    ) -> "AgentOsAgent":
-        """Create an Agent OS Agent.
-        
-        This is a convenience method that creates an AgentOsAgent with the default
-        Agent OS instruction. It's equivalent to calling AgentOsAgent() directly.
-        
-        Args:
-            agent_os_path: Path to Agent OS installation (for compatibility, not used)
-            project_path: Path to project root (for compatibility, not used)
-            **kwargs: Arguments for the agent (name, model, etc.)
-            
-        Returns:
-            Configured Agent OS Agent
-        """
-        # Note: agent_os_path and project_path are kept for backward compatibility
-        # but are not used since all Agent OS guidance is now in the base instruction
-        return cls(**kwargs)
 
-    def add_agent_os_subagents(self, agent_os_path: str) -> None:
-        """Add Agent OS subagents to this agent.
-        
-        Args:
-            agent_os_path: Path to the Agent OS installation
-        """
-        subagents = []
-        
-        # Create context-fetcher subagent
-        context_fetcher = LlmAgent(
-            name="context_fetcher",
-            model="iflow/Qwen3-Coder",
-            instruction=self._get_context_fetcher_instruction(),
-            description="Retrieves and extracts relevant information from Agent OS documentation files",
-            tools=[create_agent_os_toolset()],
-        )
-        subagents.append(context_fetcher)
-        
-        # Create file-creator subagent
-        file_creator = LlmAgent(
-            name="file_creator",
-            model="iflow/Qwen3-Coder",
-            instruction=self._get_file_creator_instruction(),
-            description="Creates files, directories, and applies templates for Agent OS workflows",
-            tools=[create_agent_os_toolset()],
-        )
-        subagents.append(file_creator)
-        
-        # Create project-manager subagent
-        project_manager = LlmAgent(
-            name="project_manager",
-            model="iflow/Qwen3-Coder",
-            instruction=self._get_project_manager_instruction(),
-            description="Manages task completion and project tracking documentation",
-            tools=[create_agent_os_toolset()],
-        )
-        subagents.append(project_manager)
-        
-        # Create git-workflow subagent
-        git_workflow = LlmAgent(
-            name="git_workflow",
-            model="iflow/Qwen3-Coder",
-            instruction=self._get_git_workflow_instruction(),
-            description="Handles git operations, branch management, commits, and PR creation",
-            tools=[create_agent_os_toolset()],
-        )
-        subagents.append(git_workflow)
-        
-        # Create test-runner subagent
-        test_runner = LlmAgent(
-            name="test_runner",
-            model="iflow/Qwen3-Coder",
-            instruction=self._get_test_runner_instruction(),
-            description="Runs tests and analyzes failures for the current task",
-            tools=[create_agent_os_toolset()],
-        )
-        subagents.append(test_runner)
-        
-        # Create date-checker subagent
-        date_checker = LlmAgent(
-            name="date_checker",
-            model="iflow/Qwen3-Coder",
-            instruction=self._get_date_checker_instruction(),
-            description="Determines and outputs today's date in YYYY-MM-DD format",
-            tools=[create_agent_os_toolset()],
-        )
-        subagents.append(date_checker)
-        
-        # Add subagents to this agent (this will set parent_agent automatically)
-        for subagent in subagents:
-            self.sub_agents.append(subagent)
-        
-        # Manually set parent agents since we're adding after initialization
-        for subagent in subagents:
-            subagent.parent_agent = self
+# Trimmed instruction for simple agents: no commands, subagents or templates.
+_SIMPLE_INSTRUCTION = """
+You are an Agent OS assistant for quick questions about a codebase.
+
+## Workflow Principles
+
+1. **Read before answering**: use read_file, grep_search and glob_search to check facts
+2. **Stay in scope**: answer the question asked; do not start Agent OS workflows
+3. **Batch independent work**: issue independent tool calls in the same turn
+
+## Response Style
 
+- Be concise and direct
+- Reference files as path:line when citing code
+- Say so plainly when something cannot be determined from the files
+""".strip()
 
-    def _get_context_fetcher_instruction(self) -> str:
-        """Get instruction for context-fetcher subagent."""
-        return """
+# Tools available to simple agents.
+_SIMPLE_TOOLS = ["read_file", "read_files", "grep_search", "glob_search"]
+
+
+_CONTEXT_FETCHER_INSTRUCTION = """
 You are a specialized information retrieval agent for Agent OS workflows.
 
 ## Instructions
@@ -329,11 +226,10 @@ When assigned a task, follow this pattern:
 - Always use `transfer_to_agent` with your parent agent's name when task is complete
 
 Always refer to `.adk/agents/context-fetcher.md` for the most up-to-date guidance.
-"""
+""".strip()
+
 
-    def _get_file_creator_instruction(self) -> str:
-        """Get instruction for file-creator subagent."""
-        return """
+_FILE_CREATOR_INSTRUCTION = """
 You are a specialized file creation agent for Agent OS projects.
 
 ## Instructions
@@ -367,11 +263,10 @@ When assigned a task, follow this pattern:
 - Always use `transfer_to_agent` with your parent agent's name when task is complete
 
 Always refer to `.adk/agents/file-creator.md` for the most up-to-date guidance.
-"""
+""".strip()
 
-    def _get_project_manager_instruction(self) -> str:
-        """Get instruction for project-manager subagent."""
-        return """
+
+_PROJECT_MANAGER_INSTRUCTION = """
 You are a specialized task completion management agent for Agent OS workflows.
 
 ## Instructions
@@ -405,11 +300,10 @@ When assigned a task, follow this pattern:
 - Always use `transfer_to_agent` with your parent agent's name when task is complete
 
 Always refer to `.adk/agents/project-manager.md` for the most up-to-date guidance.
-"""
+""".strip()
+
 
-    def _get_git_workflow_instruction(self) -> str:
-        """Get instruction for git-workflow subagent."""
-        return """
+_GIT_WORKFLOW_INSTRUCTION = """
 You are a specialized git workflow agent for Agent OS projects.
 
 ## Instructions
@@ -443,11 +337,10 @@ When assigned a task, follow this pattern:
 - Always use `transfer_to_agent` with your parent agent's name when task is complete
 
 Always refer to `.adk/agents/git-workflow.md` for the most up-to-date guidance.
-"""
+""".strip()
+
 
-    def _get_test_runner_instruction(self) -> str:
-        """Get instruction for test-runner subagent."""
-        return """
+_TEST_RUNNER_INSTRUCTION = """
 You are a specialized test execution agent.
 
 ## Instructions
@@ -480,11 +373,10 @@ When assigned a task, follow this pattern:
 - Always use `transfer_to_agent` with your parent agent's name when task is complete
 
 Always refer to `.adk/agents/test-runner.md` for the most up-to-date guidance.
-"""
+""".strip()
 
-    def _get_date_checker_instruction(self) -> str:
-        """Get instruction for date-checker subagent."""
-        return """
+
+_DATE_CHECKER_INSTRUCTION = """
 You are a specialized date determination agent for Agent OS workflows.
 
 ## Instructions
@@ -517,4 +409,233 @@ When assigned a task, follow this pattern:
 - Always use `transfer_to_agent` with your parent agent's name when task is complete
 
 Always refer to `.adk/agents/date-checker.md` for the most up-to-date guidance.
-"""
+""".strip()
+
+
+# (name, description, instruction) for each Agent OS subagent.
+_SUBAGENT_SPECS = (
+    (
+        "context_fetcher",
+        "Retrieves and extracts relevant information from Agent OS documentation files",
+        _CONTEXT_FETCHER_INSTRUCTION,
+    ),
+    (
+        "file_creator",
+        "Creates files, directories, and applies templates for Agent OS workflows",
+        _FILE_CREATOR_INSTRUCTION,
+    ),
+    (
+        "project_manager",
+        "Manages task completion and project tracking documentation",
+        _PROJECT_MANAGER_INSTRUCTION,
+    ),
+    (
+        "git_workflow",
+        "Handles git operations, branch management, commits, and PR creation",
+        _GIT_WORKFLOW_INSTRUCTION,
+    ),
+    (
+        "test_runner",
+        "Runs tests and analyzes failures for the current task",
+        _TEST_RUNNER_INSTRUCTION,
+    ),
+    (
+        "date_checker",
+        "Determines and outputs today's date in YYYY-MM-DD format",
+        _DATE_CHECKER_INSTRUCTION,
+    ),
+)
+
+
+# UTF-8 encodings of the built-in instructions, computed once at import.
+_INSTRUCTION_UTF8 = {
+    text: text.encode("utf-8")
+    for text in (
+        _DEFAULT_INSTRUCTION,
+        _SIMPLE_INSTRUCTION,
+        *(instruction for _, _, instruction in _SUBAGENT_SPECS),
+    )
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_toolset():
+    """Return the one Agent OS toolset shared by every agent in the process.
+
+    The toolset holds no per-agent state, so the root agent and all of its
+    subagents can reference the same instance. The tools module is imported
+    here, on first use, so importing this module stays cheap.
+    """
+    try:
+        from ..agent_os_tools import create_agent_os_toolset
+    except ImportError:
+        from agent_os_tools import create_agent_os_toolset
+    return create_agent_os_toolset()
+
+
+@functools.lru_cache(maxsize=1)
+def _simple_toolset():
+    """Return the shared toolset for simple agents: read-only search tools."""
+    try:
+        from ..agent_os_tools import create_agent_os_toolset
+    except ImportError:
+        from agent_os_tools import create_agent_os_toolset
+    return create_agent_os_toolset(_SIMPLE_TOOLS)
+
+
+@functools.lru_cache(maxsize=16)
+def _prototype_subagent(name: str, model: str) -> LlmAgent:
+    """Return the cached prototype for one Agent OS subagent on one model.
+
+    Every parent agent gets a clone of the prototype, so the instruction
+    strings and toolset are built once per ``(name, model)`` in the process.
+    """
+    description, instruction = _SUBAGENT_SPECS_BY_NAME[name]
+    return LlmAgent(
+        name=name,
+        model=model,
+        instruction=instruction,
+        description=description,
+        tools=[_shared_toolset()],
+    )
+
+
+_SUBAGENT_SPECS_BY_NAME = {
+    name: (description, instruction)
+    for name, description, instruction in _SUBAGENT_SPECS
+}
+
+
+class AgentOsAgent(LlmAgent):
+    """Agent OS Agent that integrates Agent OS workflows with ADK."""
+
+    def __init__(
+        self,
+        name: str = "agent_os",
+        model: str = _DEFAULT_MODEL,
+        instruction: str = "",
+        description: str = "A specialized coding agent that follows Agent OS workflows for spec-driven development",
+        simple: bool = False,
+        **kwargs
+    ):
+        # Default instruction for Agent OS Agent
+        if not instruction:
+            if simple:
+                instruction = _SIMPLE_INSTRUCTION
+            else:
+                instruction = self._get_default_instruction()
+        
+        # Add Agent OS tools
+        tools = kwargs.get("tools", [])
+        tools.append(_simple_toolset() if simple else _shared_toolset())
+        kwargs["tools"] = tools
+
+        super().__init__(
+            name=name,
+            model=model,
+            instruction=instruction,
+            description=description,
+            **kwargs
+        )
+
+    def _get_default_instruction(self) -> str:
+        """Get the default instruction for Agent OS Agent."""
+        return self._get_default_instruction_static()
+    
+    @staticmethod
+    def _get_default_instruction_static() -> str:
+        """Get the default instruction for Agent OS Agent (static version)."""
+        return _DEFAULT_INSTRUCTION
+
+    def instruction_bytes(self) -> bytes:
+        """Return this agent's instruction encoded as UTF-8.
+
+        The built-in instructions are served from a cache filled at import.
+        """
+        if not isinstance(self.instruction, str):
+            raise TypeError("instruction_bytes() requires a string instruction")
+        cached = _INSTRUCTION_UTF8.get(self.instruction)
+        if cached is None:
+            return self.instruction.encode("utf-8")
+        return cached
+
+    @classmethod
+    def create_with_agent_os(
+        cls,
+        agent_os_path: str = ".agent-os",
+        project_path: str = ".",
+        simple: bool = False,
+        **kwargs
+    ) -> "AgentOsAgent":
+        """Create an Agent OS Agent.
+        
+        This is a convenience method that creates an AgentOsAgent with the default
+        Agent OS instruction. It's equivalent to calling AgentOsAgent() directly.
+        
+        Args:
+            agent_os_path: Path to Agent OS installation (for compatibility, not used)
+            project_path: Path to project root (for compatibility, not used)
+            simple: Use a short instruction and only the read-only search
+                tools, for quick questions that need no Agent OS workflow.
+                Do not call add_agent_os_subagents on a simple agent.
+            **kwargs: Arguments for the agent (name, model, etc.)
+            
+        Returns:
+            Configured Agent OS Agent
+        """
+        # Note: agent_os_path and project_path are kept for backward compatibility
+        # but are not used since all Agent OS guidance is now in the base instruction
+        return cls(simple=simple, **kwargs)
+
+    def add_agent_os_subagents(
+        self, agent_os_path: str, names: Optional[Sequence[str]] = None
+    ) -> None:
+        """Add Agent OS subagents to this agent.
+        
+        Args:
+            agent_os_path: Path to the Agent OS installation
+            names: Subagents to add; all of them when omitted. Commands that
+                only delegate to a few subagents can skip building the rest.
+        """
+        if names is None:
+            names = _SUBAGENT_SPECS_BY_NAME
+        subagents = []
+        for name in names:
+            subagent = self._build_subagent(name)
+            # Manually set the parent since we're adding after initialization
+            subagent.parent_agent = self
+            subagents.append(subagent)
+        self.sub_agents.extend(subagents)
+
+    def enable_subagent(self, name: str) -> LlmAgent:
+        """Add a single Agent OS subagent to this agent if it is not present.
+
+        Args:
+            name: Name of the subagent, e.g. "git_workflow"
+
+        Returns:
+            The subagent attached to this agent under that name
+        """
+        for sub_agent in self.sub_agents:
+            if sub_agent.name == name:
+                return sub_agent
+        subagent = self._build_subagent(name)
+        subagent.parent_agent = self
+        self.sub_agents.append(subagent)
+        return subagent
+
+    def _build_subagent(self, name: str) -> LlmAgent:
+        """Build the named Agent OS subagent for this agent's model."""
+        if name not in _SUBAGENT_SPECS_BY_NAME:
+            raise ValueError(f"Unknown Agent OS subagent: {name}")
+        if isinstance(self.model, str):
+            return _prototype_subagent(name, self.model).clone()
+        # Model instances are not hashable, so build these directly.
+        description, instruction = _SUBAGENT_SPECS_BY_NAME[name]
+        return LlmAgent(
+            name=name,
+            model=self.model,
+            instruction=instruction,
+            description=description,
+            tools=[_shared_toolset()],
+        )
@@ -2,9 +2,13 @@
 """Tests for Agent OS integration with ADK."""
 
 import asyncio
+import glob
+import os
 import tempfile
 from pathlib import Path
 
+import pytest
+
 # Import from the ADK source directory
 import sys
 from pathlib import Path as PathLib
@@ -19,8 +23,99 @@ src_dir = current_dir.parent.parent.parent / "src"
 sys.path.insert(0, str(src_dir))
 
 from google.adk.agents.llm_agent import LlmAgent
+import agent_os_tools
+from agent_os_tools import _ReadCache
+from agent_os_tools import _scandir_glob
 from agent_os_tools import create_agent_os_toolset
 from agent_os_agent import AgentOsAgent
+from agent_os_agent import _prototype_subagent
+
+
+# Patterns checked against glob.glob(recursive=True) by test_scandir_glob.
+_GLOB_PATTERNS = [
+    "**/*.py",
+    "**",
+    "**/sub/*.py",
+    "pkg/**/*.py",
+    "*.md",
+    ".hidden/*",
+    "**/.*",
+    "pkg/sub/mod.py",
+    "pkg/sub",
+    "pkg/[ab]*.py",
+    "pkg/[!a]*.py",
+    "pkg/?.py",
+    "missing/*.py",
+]
+
+
+# (command, expected stdout, whether it needs the shell) for
+# test_bash_command_routing, run in a directory holding seed.txt.
+_BASH_CASES = [
+    ("echo hello", "hello\n", False),
+    ("ls", "seed.txt\n", False),
+    ("echo a | tr a b", "b\n", True),
+    ("echo hi > out.txt && cat out.txt", "hi\n", True),
+    ("false || echo fallback", "fallback\n", True),
+    ("echo *.txt", "seed.txt\n", True),
+    ("echo $HOME", os.environ.get("HOME", "") + "\n", True),
+    ("cd . && echo moved", "moved\n", True),
+]
+
+
+async def _run_bash_tool(bash_tool, args):
+    """Run the bash tool, returning its result and the shell flag of each run."""
+    shell_flags = []
+    original_run = agent_os_tools._run
+    
+    async def recording_run(cmd, **kwargs):
+        shell_flags.append(kwargs.get("shell", False))
+        return await original_run(cmd, **kwargs)
+    
+    # Mock tool context
+    class MockToolContext:
+        pass
+    
+    agent_os_tools._run = recording_run
+    try:
+        result = await bash_tool.run_async(
+            args=args, tool_context=MockToolContext()
+        )
+    finally:
+        agent_os_tools._run = original_run
+    return result, shell_flags
+
+
+def _is_running(pid):
+    """Return whether ``pid`` is a live process (not gone or a zombie)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    stat_path = Path(f"/proc/{pid}/stat")
+    if stat_path.exists():
+        # The state follows the parenthesised command name.
+        return stat_path.read_text().rsplit(")", 1)[1].split()[0] != "Z"
+    return True
+
+
+def _make_glob_tree(root):
+    """Create a small tree with nested, hidden and bracket-matchable files."""
+    for rel_path in [
+        "README.md",
+        "setup.py",
+        ".env",
+        ".hidden/secret.py",
+        "pkg/a.py",
+        "pkg/b.py",
+        "pkg/c.txt",
+        "pkg/.dot.py",
+        "pkg/sub/mod.py",
+        "pkg/sub/deep/x.py",
+    ]:
+        path = Path(root) / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel_path)
 
 
 class TestAgentOsIntegration:
@@ -30,7 +125,7 @@ class TestAgentOsIntegration:
         """Test creating Agent OS toolset."""
         toolset = create_agent_os_toolset()
         assert toolset is not None
-        assert len(toolset.tools) == 5  # 5 tools in the toolset
+        assert len(toolset.tools) == 7  # 7 tools in the toolset
 
     def test_agent_os_agent_creation(self):
         """Test creating Agent OS Agent."""
@@ -78,6 +173,124 @@ class TestAgentOsIntegration:
             assert "test_runner" in subagent_names
             assert "date_checker" in subagent_names
 
+    def test_add_selected_agent_os_subagents(self):
+        """Test adding a subset of Agent OS subagents."""
+        agent = AgentOsAgent(name="test_agent")
+        
+        agent.add_agent_os_subagents(
+            ".agent-os", names=["git_workflow", "test_runner"]
+        )
+        
+        assert [sub.name for sub in agent.sub_agents] == [
+            "git_workflow", "test_runner"
+        ]
+        assert all(sub.parent_agent is agent for sub in agent.sub_agents)
+
+    def test_unknown_agent_os_subagent(self):
+        """Test that unknown subagent names are rejected."""
+        agent = AgentOsAgent(name="test_agent")
+        
+        for add in (
+            lambda: agent.enable_subagent("no_such_agent"),
+            lambda: agent.add_agent_os_subagents(
+                ".agent-os", names=["no_such_agent"]
+            ),
+        ):
+            try:
+                add()
+            except ValueError as e:
+                assert "no_such_agent" in str(e)
+            else:
+                raise AssertionError("unknown subagent was accepted")
+        assert len(agent.sub_agents) == 0
+
+    def test_enable_subagent_is_idempotent(self):
+        """Test that enabling a subagent twice attaches it once."""
+        agent = AgentOsAgent(name="test_agent")
+        
+        first = agent.enable_subagent("date_checker")
+        second = agent.enable_subagent("date_checker")
+        
+        assert first is second
+        assert [sub.name for sub in agent.sub_agents] == ["date_checker"]
+        assert first.parent_agent is agent
+
+    def test_subagent_clones_are_independent(self):
+        """Test that subagents cloned from one prototype share no state."""
+        first = AgentOsAgent(name="first_agent")
+        second = AgentOsAgent(name="second_agent")
+        
+        first.add_agent_os_subagents(".agent-os")
+        second.add_agent_os_subagents(".agent-os")
+        
+        prototype = _prototype_subagent("git_workflow", first.model)
+        assert prototype.parent_agent is None
+        assert prototype.sub_agents == []
+        for first_sub, second_sub in zip(first.sub_agents, second.sub_agents):
+            assert first_sub is not second_sub
+            assert first_sub is not prototype
+            assert first_sub.parent_agent is first
+            assert second_sub.parent_agent is second
+            assert first_sub.sub_agents is not second_sub.sub_agents
+            assert first_sub.tools is not second_sub.tools
+
+    def test_simple_agent_os_agent(self):
+        """Test creating a simple Agent OS Agent."""
+        agent = AgentOsAgent.create_with_agent_os(
+            name="simple_agent",
+            simple=True,
+        )
+        assert agent.name == "simple_agent"
+        assert len(agent.instruction) < 1000  # Trimmed instruction
+        assert len(agent.sub_agents) == 0
+        assert len(agent.tools) == 1  # Should have Agent OS toolset
+        tool_names = [tool.name for tool in agent.tools[0].tools]
+        assert tool_names == [
+            "read_file", "grep_search", "glob_search", "read_files"
+        ]
+
+    async def test_toolset_name_filter(self):
+        """Test filtering the Agent OS toolset by tool name."""
+        toolset = create_agent_os_toolset(["grep_search", "read_file"])
+        
+        tools = await toolset.get_tools()
+        
+        assert [tool.name for tool in tools] == ["read_file", "grep_search"]
+
+    async def test_toolset_predicate_filter(self):
+        """Test filtering the Agent OS toolset with a predicate."""
+        toolset = create_agent_os_toolset(
+            lambda tool, readonly_context=None: tool.name.startswith("read")
+        )
+        
+        tools = await toolset.get_tools()
+        
+        assert [tool.name for tool in tools] == ["read_file", "read_files"]
+
+    def test_toolsets_do_not_share_tools(self):
+        """Test that each Agent OS toolset has its own tool instances."""
+        first = create_agent_os_toolset()
+        second = create_agent_os_toolset()
+        
+        for first_tool, second_tool in zip(first.tools, second.tools):
+            assert first_tool is not second_tool
+        
+        first.tools[0].name = "renamed"
+        assert second.tools[0].name == "read_file"
+
+    async def test_prefixed_toolset_keeps_declarations_separate(self):
+        """Test that a prefixed toolset does not rename other toolsets' tools."""
+        plain = create_agent_os_toolset()
+        prefixed = create_agent_os_toolset()
+        prefixed.tool_name_prefix = "x"
+        
+        for _ in range(2):
+            for tool in await prefixed.get_tools_with_prefix():
+                assert tool._get_declaration().name == f"x_{tool.name[2:]}"
+        
+        for tool in await plain.get_tools_with_prefix():
+            assert tool._get_declaration().name == tool.name
+
     async def test_agent_os_tools(self):
         """Test Agent OS tools functionality."""
         toolset = create_agent_os_toolset()
@@ -106,6 +319,124 @@ class TestAgentOsIntegration:
         finally:
             Path(temp_file).unlink()
 
+    async def test_read_cache_sees_tool_writes(self):
+        """Test that read_file never serves content replaced by a tool."""
+        toolset = create_agent_os_toolset()
+        read_tool = toolset.tools[0]  # AgentOsReadTool
+        write_tool = toolset.tools[1]  # AgentOsWriteTool
+        bash_tool = toolset.tools[4]  # AgentOsBashTool
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = Path(temp_dir) / "test.txt"
+            test_file.write_text("first")
+            
+            # Mock tool context
+            class MockToolContext:
+                pass
+            
+            async def read():
+                result = await read_tool.run_async(
+                    args={"file_path": str(test_file)},
+                    tool_context=MockToolContext()
+                )
+                return result["content"]
+            
+            # Same-size rewrites, back to back, through each writing tool
+            assert await read() == "first"
+            await write_tool.run_async(
+                args={
+                    "file_path": str(test_file),
+                    "content": "secnd",
+                    "overwrite": True
+                },
+                tool_context=MockToolContext()
+            )
+            assert await read() == "secnd"
+            await bash_tool.run_async(
+                args={"command": f"printf third > '{test_file}'"},
+                tool_context=MockToolContext()
+            )
+            assert await read() == "third"
+
+    def test_scandir_glob(self):
+        """Test that the glob walker matches glob.glob(recursive=True)."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _make_glob_tree(temp_dir)
+            
+            for pattern in _GLOB_PATTERNS:
+                expected = glob.glob(
+                    os.path.join(temp_dir, pattern), recursive=True
+                )
+                # A trailing ** also makes glob yield the root itself.
+                expected = [p for p in expected if not p.endswith(os.sep)]
+                actual = _scandir_glob(temp_dir, pattern, limit=1000)
+                assert sorted(actual) == sorted(expected), pattern
+
+    def test_scandir_glob_limit(self):
+        """Test that the glob walker stops at its limit."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _make_glob_tree(temp_dir)
+            everything = glob.glob(
+                os.path.join(temp_dir, "**/*.py"), recursive=True
+            )
+            
+            actual = _scandir_glob(temp_dir, "**/*.py", limit=2)
+            
+            assert len(actual) == 2
+            assert set(actual) <= set(everything)
+
+    def test_read_cache_is_bounded(self):
+        """Test that the read cache evicts least recently used files."""
+        cache = _ReadCache(max_bytes=10)
+        cache.put("a", (1,), "aaaaaa", 6)
+        cache.put("b", (1,), "bbbbbb", 6)
+        
+        assert cache.get("a", (1,)) is None
+        assert cache.get("b", (1,)) == "bbbbbb"
+        assert cache.get("b", (2,)) is None  # Stale signature
+
+    async def test_read_files_tool(self):
+        """Test read_files tool with existing, missing and unreadable paths."""
+        toolset = create_agent_os_toolset()
+        read_files_tool = toolset.tools[6]  # AgentOsBatchReadTool
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for name in ["c.txt", "a.txt", "b.txt"]:
+                path = Path(temp_dir) / name
+                path.write_text(f"content of {name}")
+                paths.append(str(path))
+            missing = str(Path(temp_dir) / "missing.txt")
+            directory = str(Path(temp_dir))
+            
+            # Mock tool context
+            class MockToolContext:
+                pass
+            
+            result = await read_files_tool.run_async(
+                args={
+                    "file_paths": [
+                        paths[0], missing, paths[1], directory, paths[2]
+                    ]
+                },
+                tool_context=MockToolContext()
+            )
+            
+            # Contents keep the order the paths were given in
+            assert list(result["contents"]) == paths
+            for path in paths:
+                assert result["contents"][path] == f"content of {Path(path).name}"
+            assert list(result["errors"]) == [missing, directory]
+            assert result["errors"][missing] == f"File not found: {missing}"
+            assert result["errors"][directory].startswith("Error reading file")
+            
+            result = await read_files_tool.run_async(
+                args={"file_paths": []},
+                tool_context=MockToolContext()
+            )
+            
+            assert result == {"error": "file_paths is required"}
+
     async def test_write_file_tool(self):
         """Test write_file tool functionality."""
         toolset = create_agent_os_toolset()
@@ -131,6 +462,32 @@ class TestAgentOsIntegration:
             assert test_file.exists()
             assert test_file.read_text() == "Test content"
 
+    async def test_write_file_tool_parent_is_file(self):
+        """Test write_file tool when a parent path component is a file."""
+        toolset = create_agent_os_toolset()
+        write_tool = toolset.tools[1]  # AgentOsWriteTool
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            blocker = Path(temp_dir) / "x.py"
+            blocker.write_text("print('hi')")
+            
+            # Mock tool context
+            class MockToolContext:
+                pass
+            
+            for overwrite in (False, True):
+                result = await write_tool.run_async(
+                    args={
+                        "file_path": str(blocker / "foo.txt"),
+                        "content": "Test content",
+                        "overwrite": overwrite
+                    },
+                    tool_context=MockToolContext()
+                )
+                
+                assert result["error"].startswith("Error writing file")
+            assert blocker.read_text() == "print('hi')"
+
     async def test_grep_tool(self):
         """Test grep tool functionality."""
         toolset = create_agent_os_toolset()
@@ -157,6 +514,109 @@ class TestAgentOsIntegration:
             assert len(result["matches"]) > 0
             assert "test" in result["matches"][0].lower()
 
+    async def test_grep_tool_long_line(self):
+        """Test grep tool on a matching line longer than the stream limit."""
+        toolset = create_agent_os_toolset()
+        grep_tool = toolset.tools[2]  # AgentOsGrepTool
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = Path(temp_dir) / "long.txt"
+            test_file.write_text("needle " + "x" * (2 << 20) + "\nneedle short\n")
+            
+            # Mock tool context
+            class MockToolContext:
+                pass
+            
+            result = await grep_tool.run_async(
+                args={
+                    "pattern": "needle",
+                    "file_path": str(test_file),
+                },
+                tool_context=MockToolContext()
+            )
+            
+            assert "matches" in result
+            assert len(result["matches"]) == 2
+            assert result["matches"][1].endswith("needle short")
+
+    @pytest.mark.parametrize("command, expected, uses_shell", _BASH_CASES)
+    async def test_bash_command_routing(self, command, expected, uses_shell):
+        """Test that only commands needing shell syntax go through bash."""
+        toolset = create_agent_os_toolset()
+        bash_tool = toolset.tools[4]  # AgentOsBashTool
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / "seed.txt").write_text("seed")
+            
+            result, shell_flags = await _run_bash_tool(
+                bash_tool,
+                {"command": command, "working_directory": temp_dir},
+            )
+            
+            assert result["return_code"] == 0
+            assert result["stdout"] == expected
+            assert shell_flags == [uses_shell]
+
+    async def test_bash_output_cap(self):
+        """Test that bash output past the cap is cut and flagged."""
+        toolset = create_agent_os_toolset()
+        bash_tool = toolset.tools[4]  # AgentOsBashTool
+        limit = agent_os_tools._MAX_OUTPUT_BYTES
+        
+        result, _ = await _run_bash_tool(
+            bash_tool, {"command": f"head -c {limit * 2} /dev/zero"}
+        )
+        
+        assert result["truncated_output"] is True
+        assert len(result["stdout"]) == limit
+        
+        result, _ = await _run_bash_tool(bash_tool, {"command": "echo small"})
+        
+        assert result["truncated_output"] is False
+
+    async def test_bash_timeout_kills_process_group(self):
+        """Test that a timed-out command and its children are killed."""
+        toolset = create_agent_os_toolset()
+        bash_tool = toolset.tools[4]  # AgentOsBashTool
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # The backgrounded sleep is a grandchild; exec makes the second
+            # sleep the direct child.
+            started = asyncio.get_running_loop().time()
+            result, _ = await _run_bash_tool(
+                bash_tool,
+                {
+                    "command": (
+                        "sleep 30 & echo $! > bg.pid; "
+                        "echo $$ > fg.pid; exec sleep 30"
+                    ),
+                    "working_directory": temp_dir,
+                    "timeout": 1,
+                },
+            )
+            
+            elapsed = asyncio.get_running_loop().time() - started
+            
+            assert result["error"] == "Command timed out after 1 seconds"
+            # A surviving grandchild would hold the output pipes open.
+            assert elapsed < 10
+            foreground = int((Path(temp_dir) / "fg.pid").read_text())
+            background = int((Path(temp_dir) / "bg.pid").read_text())
+            
+            # The direct child must already be reaped.
+            try:
+                os.kill(foreground, 0)
+            except ProcessLookupError:
+                pass
+            else:
+                raise AssertionError("timed-out child was not reaped")
+            
+            for _ in range(50):
+                if not _is_running(background):
+                    break
+                await asyncio.sleep(0.02)
+            assert not _is_running(background)
+
     async def test_glob_tool(self):
         """Test glob tool functionality."""
         toolset = create_agent_os_toolset()
@@ -189,18 +649,54 @@ async def run_async_tests():
     """Run async tests."""
     test = TestAgentOsIntegration()
     
+    # Test toolset filters
+    await test.test_toolset_name_filter()
+    print("✓ Toolset name filter test passed")
+    
+    await test.test_toolset_predicate_filter()
+    print("✓ Toolset predicate filter test passed")
+    
+    await test.test_prefixed_toolset_keeps_declarations_separate()
+    print("✓ Prefixed toolset test passed")
+    
     # Test agent OS tools
     await test.test_agent_os_tools()
     print("✓ Agent OS tools test passed")
     
+    # Test read_files tool
+    await test.test_read_files_tool()
+    print("✓ Read files tool test passed")
+    
+    # Test read cache
+    await test.test_read_cache_sees_tool_writes()
+    print("✓ Read cache test passed")
+    
     # Test write file tool
     await test.test_write_file_tool()
     print("✓ Write file tool test passed")
     
+    # Test write file tool with a file in the parent path
+    await test.test_write_file_tool_parent_is_file()
+    print("✓ Write file tool parent path test passed")
+    
     # Test grep tool
     await test.test_grep_tool()
     print("✓ Grep tool test passed")
     
+    # Test grep tool with an oversized line
+    await test.test_grep_tool_long_line()
+    print("✓ Grep tool long line test passed")
+    
+    # Test bash tool routing
+    for command, expected, uses_shell in _BASH_CASES:
+        await test.test_bash_command_routing(command, expected, uses_shell)
+    print("✓ Bash tool routing tests passed")
+    
+    # Test bash tool limits
+    await test.test_bash_output_cap()
+    await test.test_bash_timeout_kills_process_group()
+    print("✓ Bash tool limit tests passed")
+    
     # Test glob tool
     await test.test_glob_tool()
     print("✓ Glob tool test passed")
@@ -228,6 +724,30 @@ if __name__ == "__main__":
     test.test_add_agent_os_subagents()
     print("✓ Subagents test passed")
     
+    # Test toolset isolation
+    test.test_toolsets_do_not_share_tools()
+    print("✓ Toolset isolation test passed")
+    
+    # Test glob walker
+    test.test_scandir_glob()
+    test.test_scandir_glob_limit()
+    print("✓ Glob walker tests passed")
+    
+    # Test read cache bound
+    test.test_read_cache_is_bounded()
+    print("✓ Read cache bound test passed")
+    
+    # Test selective subagents
+    test.test_add_selected_agent_os_subagents()
+    test.test_unknown_agent_os_subagent()
+    test.test_enable_subagent_is_idempotent()
+    test.test_subagent_clones_are_independent()
+    print("✓ Selective subagent tests passed")
+    
+    # Test simple agent
+    test.test_simple_agent_os_agent()
+    print("✓ Simple agent test passed")
+    
     # Run async tests
     print("\nRunning async tests...")
     asyncio.run(run_async_tests())
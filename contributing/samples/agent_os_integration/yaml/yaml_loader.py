@@ -14,26 +14,55 @@
 
 """YAML configuration loader for Agent OS integration."""
 
+import copy
+import functools
 import os
-import yaml
+import re
+import sys
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
-# Import from the parent directory
-import sys
-from pathlib import Path as PathLib
+if __package__:
+    from ..python.agent_os_agent import AgentOsAgent
+else:
+    # Imported as a top-level module by the scripts in this directory;
+    # AgentOsAgent lives in the sibling python/ directory.
+    _PYTHON_DIR = str(Path(__file__).resolve().parent.parent / "python")
+    if _PYTHON_DIR not in sys.path:
+        sys.path.append(_PYTHON_DIR)
+    from agent_os_agent import AgentOsAgent
 
-# Add the src directory to Python path for imports
-current_dir = PathLib(__file__).parent
-src_dir = current_dir.parent.parent.parent / "src"
-sys.path.insert(0, str(src_dir))
+# Matches ${VAR} and $VAR references in config strings.
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)')
+
+_DEFAULT_CONFIG_PATH = Path(__file__).parent / "root_agent.yaml"
+
+# Shared read-only stand-in for a missing config section.
+_EMPTY = MappingProxyType({})
+
+# Parsed configs by resolved path, as ((st_mtime_ns, st_size), config); an
+# edited file replaces its own entry. Each loader gets its own deep copy, so
+# changes one loader makes never reach the cache or another loader.
+_CONFIG_CACHE: Dict[str, Any] = {}
 
-try:
-    from .agent_os_agent import AgentOsAgent
-    from .agent_os_tools import create_agent_os_toolset
-except ImportError:
-    from agent_os_agent import AgentOsAgent
-    from agent_os_tools import create_agent_os_toolset
+
+@functools.lru_cache(maxsize=1)
+def _yaml_load():
+    """Import PyYAML on first use and return its safe ``load``.
+
+    Parses with libyaml's C loader when PyYAML was built with it.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return functools.partial(yaml.load, Loader=loader)
+
+
+def _replace_env_var(env: Dict[str, str], match) -> str:
+    """Substitute one env var reference, leaving unset ones untouched."""
+    var_name = match.group(1) or match.group(2)
+    return env.get(var_name, match.group(0))
 
 
 class AgentOsYamlLoader:
@@ -46,10 +75,19 @@ class AgentOsYamlLoader:
             config_path: Path to the YAML configuration file. If None, uses default.
         """
         if config_path is None:
-            config_path = Path(__file__).parent / "root_agent.yaml"
-        
-        self.config_path = Path(config_path)
+            self.config_path = _DEFAULT_CONFIG_PATH
+        elif isinstance(config_path, Path):
+            self.config_path = config_path
+        else:
+            self.config_path = Path(config_path)
         self.config = self._load_config()
+        
+        # Look each top-level section up once; the getters return these.
+        self._agent_config = self.config.get('agent') or {}
+        self._workflows = self.config.get('workflows') or {}
+        self._runner_config = self.config.get('runner') or {}
+        self._logging_config = self.config.get('logging') or {}
+        self._environment_config = self.config.get('environment') or {}
     
     def _load_config(self) -> Dict[str, Any]:
         """Load the YAML configuration file.
@@ -61,50 +99,80 @@ class AgentOsYamlLoader:
             FileNotFoundError: If the configuration file doesn't exist.
             yaml.YAMLError: If the YAML file is malformed.
         """
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-        
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-        
-        return config
+        try:
+            f = open(self.config_path, 'rb')
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Configuration file not found: {self.config_path}"
+            ) from None
+        
+        with f:
+            # fstat the open file rather than stat()ing the path again. The
+            # size catches edits made within one mtime tick.
+            st = os.fstat(f.fileno())
+            signature = (st.st_mtime_ns, st.st_size)
+            key = str(self.config_path.resolve())
+            cached = _CONFIG_CACHE.get(key)
+            if cached is not None and cached[0] == signature:
+                return copy.deepcopy(cached[1])
+            # One read of the raw bytes; the loader decodes the UTF-8 itself.
+            data = f.read()
+        config = _yaml_load()(data)
+        
+        _CONFIG_CACHE[key] = (signature, config)
+        return copy.deepcopy(config)
     
-    def _resolve_environment_variables(self, value: str) -> str:
+    def _resolve_environment_variables(
+        self, value: str, env: Optional[Dict[str, str]] = None
+    ) -> str:
         """Resolve environment variables in a string value.
         
         Args:
             value: String that may contain environment variables.
+            env: Environment mapping to resolve from. Defaults to os.environ.
             
         Returns:
             String with environment variables resolved.
         """
-        if isinstance(value, str):
-            # Handle ${VAR} and $VAR syntax
-            import re
-            pattern = r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)'
-            
-            def replace_var(match):
-                var_name = match.group(1) or match.group(2)
-                return os.getenv(var_name, match.group(0))
-            
-            return re.sub(pattern, replace_var, value)
+        # Most scalars reference no variables; skip the regex for those.
+        if isinstance(value, str) and '$' in value:
+            if env is None:
+                env = os.environ
+            return _ENV_VAR_RE.sub(functools.partial(_replace_env_var, env), value)
         return value
     
-    def _resolve_config_values(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    def _resolve_config_values(
+        self, config: Dict[str, Any], env: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
         """Recursively resolve environment variables in configuration.
         
         Args:
             config: Configuration dictionary.
+            env: Environment snapshot shared by the recursion. The top-level
+                call takes a plain-dict copy of os.environ.
             
         Returns:
-            Configuration with environment variables resolved.
+            Configuration with environment variables resolved. Containers
+            with nothing to substitute are returned as-is rather than copied.
         """
+        if env is None:
+            env = dict(os.environ)
         if isinstance(config, dict):
-            return {key: self._resolve_config_values(value) for key, value in config.items()}
+            changed = False
+            resolved = {}
+            for key, value in config.items():
+                new_value = self._resolve_config_values(value, env)
+                if new_value is not value:
+                    changed = True
+                resolved[key] = new_value
+            return resolved if changed else config
         elif isinstance(config, list):
-            return [self._resolve_config_values(item) for item in config]
+            resolved = [self._resolve_config_values(item, env) for item in config]
+            if any(new is not old for new, old in zip(resolved, config)):
+                return resolved
+            return config
         elif isinstance(config, str):
-            return self._resolve_environment_variables(config)
+            return self._resolve_environment_variables(config, env)
         else:
             return config
     
@@ -114,38 +182,36 @@ class AgentOsYamlLoader:
         Returns:
             Configured Agent OS agent.
         """
-        # Resolve environment variables
-        resolved_config = self._resolve_config_values(self.config)
-        
-        agent_config = resolved_config.get('agent', {})
+        agent_get = self.get_agent_config().get
         
         # Extract basic agent configuration
-        name = agent_config.get('name', 'agent_os_agent')
-        model = agent_config.get('model', 'iflow/Qwen3-Coder')
-        description = agent_config.get('description', 'Agent OS Agent')
-        instruction = agent_config.get('instruction', '')
+        name = agent_get('name', 'agent_os_agent')
+        model = agent_get('model', 'iflow/Qwen3-Coder')
+        description = agent_get('description', 'Agent OS Agent')
+        instruction = agent_get('instruction', '')
         
         # Extract Agent OS specific configuration
-        agent_os_config = agent_config.get('agent_os', {})
+        agent_os_get = (agent_get('agent_os') or _EMPTY).get
         # Default to .agent-os directory (users install agent-os here)
-        default_agent_os_path = ".agent-os"
-        agent_os_path = agent_os_config.get('path', default_agent_os_path)
-        project_path = agent_os_config.get('project_path', '.')
-        auto_load_config = agent_os_config.get('auto_load_config', True)
-        auto_add_subagents = agent_os_config.get('auto_add_subagents', True)
+        agent_os_path = agent_os_get('path', '.agent-os')
+        project_path = agent_os_get('project_path', '.')
+        auto_load_config = agent_os_get('auto_load_config', True)
+        auto_add_subagents = agent_os_get('auto_add_subagents', True)
         
         # Create the agent
         if auto_load_config:
-            agent = AgentOsAgent.create_with_agent_os_config(
+            kwargs = dict(
                 agent_os_path=agent_os_path,
                 project_path=project_path,
                 name=name,
                 model=model,
                 description=description
             )
-            # Override instruction if provided
+            # Pass a configured instruction through so the default is
+            # never built just to be replaced
             if instruction:
-                agent.instruction = instruction
+                kwargs['instruction'] = instruction
+            agent = AgentOsAgent.create_with_agent_os(**kwargs)
         else:
             agent = AgentOsAgent(
                 name=name,
@@ -155,19 +221,27 @@ class AgentOsYamlLoader:
             )
         
         # Add subagents if configured
-        subagents_config = agent_config.get('subagents', {})
+        subagents_config = agent_get('subagents') or _EMPTY
         if subagents_config.get('enabled', True) and auto_add_subagents:
             agent.add_agent_os_subagents(agent_os_path)
         
         return agent
     
+    def get_agent_config(self) -> Dict[str, Any]:
+        """Get the agent section with environment variables resolved.
+        
+        Returns:
+            Agent configuration dictionary.
+        """
+        return self._resolve_config_values(self._agent_config)
+    
     def get_workflows(self) -> Dict[str, Any]:
         """Get available workflows from the configuration.
         
         Returns:
             Dictionary of workflow configurations.
         """
-        return self.config.get('workflows', {})
+        return self._workflows
     
     def get_runner_config(self) -> Dict[str, Any]:
         """Get runner configuration.
@@ -175,7 +249,7 @@ class AgentOsYamlLoader:
         Returns:
             Runner configuration dictionary.
         """
-        return self.config.get('runner', {})
+        return self._runner_config
     
     def get_logging_config(self) -> Dict[str, Any]:
         """Get logging configuration.
@@ -183,7 +257,7 @@ class AgentOsYamlLoader:
         Returns:
             Logging configuration dictionary.
         """
-        return self.config.get('logging', {})
+        return self._logging_config
     
     def get_environment_config(self) -> Dict[str, Any]:
         """Get environment configuration.
@@ -191,7 +265,7 @@ class AgentOsYamlLoader:
         Returns:
             Environment configuration dictionary.
         """
-        return self.config.get('environment', {})
+        return self._environment_config
     
     def validate_environment(self) -> bool:
         """Validate that required environment variables are set.
@@ -200,12 +274,11 @@ class AgentOsYamlLoader:
             True if all required environment variables are set, False otherwise.
         """
         env_config = self.get_environment_config()
-        required_vars = env_config.get('required_vars', [])
+        required_vars = env_config.get('required_vars') or ()
         
-        missing_vars = []
-        for var in required_vars:
-            if not os.getenv(var):
-                missing_vars.append(var)
+        # Empty values count as missing, as they did with os.getenv.
+        env_get = os.environ.get
+        missing_vars = [var for var in required_vars if not env_get(var)]
         
         if missing_vars:
             print(f"Missing required environment variables: {', '.join(missing_vars)}")
@@ -215,26 +288,34 @@ class AgentOsYamlLoader:
     
     def print_config_summary(self):
         """Print a summary of the loaded configuration."""
-        agent_config = self.config.get('agent', {})
-        agent_os_config = agent_config.get('agent_os', {})
-        
-        print("🤖 Agent OS Configuration Summary")
-        print("=" * 40)
-        print(f"Agent Name: {agent_config.get('name', 'N/A')}")
-        print(f"Model: {agent_config.get('model', 'N/A')}")
-        print(f"Agent OS Path: {agent_os_config.get('path', 'N/A')}")
-        print(f"Project Path: {agent_os_config.get('project_path', 'N/A')}")
-        print(f"Auto Load Config: {agent_os_config.get('auto_load_config', 'N/A')}")
-        print(f"Auto Add Subagents: {agent_os_config.get('auto_add_subagents', 'N/A')}")
-        
-        subagents_config = agent_config.get('subagents', {})
+        agent_config = self.get_agent_config()
+        agent_os_config = agent_config.get('agent_os') or {}
+        
+        lines = [
+            "🤖 Agent OS Configuration Summary",
+            "=" * 40,
+            f"Agent Name: {agent_config.get('name', 'N/A')}",
+            f"Model: {agent_config.get('model', 'N/A')}",
+            f"Agent OS Path: {agent_os_config.get('path', 'N/A')}",
+            f"Project Path: {agent_os_config.get('project_path', 'N/A')}",
+            f"Auto Load Config: {agent_os_config.get('auto_load_config', 'N/A')}",
+            f"Auto Add Subagents: {agent_os_config.get('auto_add_subagents', 'N/A')}",
+        ]
+        
+        subagents_config = agent_config.get('subagents') or {}
         if subagents_config.get('enabled', False):
-            print(f"Subagents: {len([k for k, v in subagents_config.items() if isinstance(v, dict) and v.get('enabled', False)])} enabled")
+            enabled = sum(
+                1 for v in subagents_config.values()
+                if isinstance(v, dict) and v.get('enabled', False)
+            )
+            lines.append(f"Subagents: {enabled} enabled")
         
         workflows = self.get_workflows()
-        print(f"Available Workflows: {len(workflows)}")
+        lines.append(f"Available Workflows: {len(workflows)}")
         for workflow_name, workflow_config in workflows.items():
-            print(f"  - {workflow_config.get('name', workflow_name)}")
+            lines.append(f"  - {workflow_config.get('name', workflow_name)}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def load_agent_from_yaml(config_path: Optional[str] = None) -> AgentOsAgent:
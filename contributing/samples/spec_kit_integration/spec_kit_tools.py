@@ -24,6 +24,7 @@ try:
     from google.adk.tools.base_tool import BaseTool
     from google.adk.tools.base_toolset import BaseToolset
     from google.adk.tools.tool_context import ToolContext
+    from google.genai import types
 except ImportError:
     import sys
     current_dir = Path(__file__).parent
@@ -33,6 +34,7 @@ except ImportError:
         from google.adk.tools.base_tool import BaseTool
         from google.adk.tools.base_toolset import BaseToolset
         from google.adk.tools.tool_context import ToolContext
+        from google.genai import types
 
 
 class SpecKitReadTool(BaseTool):
@@ -44,11 +46,13 @@ class SpecKitReadTool(BaseTool):
             description="Read the contents of a file. Use this to examine files in the project.",
         )
 
-    def _get_declaration(self) -> Optional['types.FunctionDeclaration']:
+    # Declarations never change, so each one is built on first use and kept.
+    _declaration = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
         """Get function declaration for the LLM."""
-        try:
-            from google.genai import types
-            return types.FunctionDeclaration(
+        if self._declaration is None:
+            self._declaration = types.FunctionDeclaration(
                 name="read_file",
                 description="Read the contents of a file. Use this to examine files in the project.",
                 parameters=types.Schema(
@@ -62,8 +66,7 @@ class SpecKitReadTool(BaseTool):
                     required=["file_path"]
                 )
             )
-        except ImportError:
-            return None
+        return self._declaration
 
     async def run_async(
         self, *, args: Dict[str, Any], tool_context: ToolContext
@@ -91,11 +94,12 @@ class SpecKitWriteTool(BaseTool):
             description="Write content to a file. Use this to create or update files in the project.",
         )
 
-    def _get_declaration(self) -> Optional['types.FunctionDeclaration']:
+    _declaration = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
         """Get function declaration for the LLM."""
-        try:
-            from google.genai import types
-            return types.FunctionDeclaration(
+        if self._declaration is None:
+            self._declaration = types.FunctionDeclaration(
                 name="write_file",
                 description="Write content to a file. Use this to create or update files in the project.",
                 parameters=types.Schema(
@@ -117,8 +121,7 @@ class SpecKitWriteTool(BaseTool):
                     required=["file_path", "content"]
                 )
             )
-        except ImportError:
-            return None
+        return self._declaration
 
     async def run_async(
         self, *, args: Dict[str, Any], tool_context: ToolContext
@@ -154,11 +157,12 @@ class SpecKitBashTool(BaseTool):
             description="Execute bash commands. Use this to run shell commands, git operations, and spec-kit scripts.",
         )
 
-    def _get_declaration(self) -> Optional['types.FunctionDeclaration']:
+    _declaration = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
         """Get function declaration for the LLM."""
-        try:
-            from google.genai import types
-            return types.FunctionDeclaration(
+        if self._declaration is None:
+            self._declaration = types.FunctionDeclaration(
                 name="bash_command",
                 description="Execute bash commands. Use this to run shell commands, git operations, and spec-kit scripts.",
                 parameters=types.Schema(
@@ -180,8 +184,7 @@ class SpecKitBashTool(BaseTool):
                     required=["command"]
                 )
             )
-        except ImportError:
-            return None
+        return self._declaration
 
     async def run_async(
         self, *, args: Dict[str, Any], tool_context: ToolContext